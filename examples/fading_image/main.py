@@ -48,12 +48,8 @@ except Exception as e:
 
 while True:
     try:
-        #fade the screen
-        for i in range(0,256):
-            ssd.set_contrast(i)
-            sleep(2)
-        for i in range(0,256):
-            ssd.set_contrast(255-i)
-            sleep(2)
+        #fade the screen: the driver runs the ramps
+        ssd.fade(0,255,512)
+        ssd.fade(255,0,512)
     except Exception as e:
         print(e)
\ No newline at end of file
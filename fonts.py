@@ -1,200 +1,207 @@
-guiFont_Tahoma_7_Regular = [
-   0x00,
-   0x00,
-   0x20,0x00,
-   0x7F,0x00,
-   0x0B,
-   0x10,
-   0x03,0x88,0x01,0x00,
-   0x01,0x93,0x01,0x00,
-   0x03,0x9E,0x01,0x00,
-   0x07,0xA9,0x01,0x00,
-   0x05,0xB4,0x01,0x00,
-   0x09,0xBF,0x01,0x00,
-   0x06,0xD5,0x01,0x00,
-   0x01,0xE0,0x01,0x00,
-   0x03,0xEB,0x01,0x00,
-   0x02,0xF6,0x01,0x00,
-   0x05,0x01,0x02,0x00,
-   0x06,0x0C,0x02,0x00,
-   0x02,0x17,0x02,0x00,
-   0x02,0x22,0x02,0x00,
-   0x02,0x2D,0x02,0x00,
-   0x03,0x38,0x02,0x00,
-   0x04,0x43,0x02,0x00,
-   0x04,0x4E,0x02,0x00,
-   0x04,0x59,0x02,0x00,
-   0x04,0x64,0x02,0x00,
-   0x05,0x6F,0x02,0x00,
-   0x04,0x7A,0x02,0x00,
-   0x04,0x85,0x02,0x00,
-   0x04,0x90,0x02,0x00,
-   0x04,0x9B,0x02,0x00,
-   0x04,0xA6,0x02,0x00,
-   0x02,0xB1,0x02,0x00,
-   0x02,0xBC,0x02,0x00,
-   0x06,0xC7,0x02,0x00,
-   0x06,0xD2,0x02,0x00,
-   0x06,0xDD,0x02,0x00,
-   0x04,0xE8,0x02,0x00,
-   0x07,0xF3,0x02,0x00,
-   0x06,0xFE,0x02,0x00,
-   0x05,0x09,0x03,0x00,
-   0x06,0x14,0x03,0x00,
-   0x06,0x1F,0x03,0x00,
-   0x05,0x2A,0x03,0x00,
-   0x05,0x35,0x03,0x00,
-   0x06,0x40,0x03,0x00,
-   0x06,0x4B,0x03,0x00,
-   0x03,0x56,0x03,0x00,
-   0x03,0x61,0x03,0x00,
-   0x05,0x6C,0x03,0x00,
-   0x04,0x77,0x03,0x00,
-   0x07,0x82,0x03,0x00,
-   0x06,0x8D,0x03,0x00,
-   0x07,0x98,0x03,0x00,
-   0x05,0xA3,0x03,0x00,
-   0x07,0xAE,0x03,0x00,
-   0x05,0xB9,0x03,0x00,
-   0x05,0xC4,0x03,0x00,
-   0x05,0xCF,0x03,0x00,
-   0x06,0xDA,0x03,0x00,
-   0x06,0xE5,0x03,0x00,
-   0x07,0xF0,0x03,0x00,
-   0x04,0xFB,0x03,0x00,
-   0x05,0x06,0x04,0x00,
-   0x04,0x11,0x04,0x00,
-   0x02,0x1C,0x04,0x00,
-   0x03,0x27,0x04,0x00,
-   0x02,0x32,0x04,0x00,
-   0x05,0x3D,0x04,0x00,
-   0x05,0x48,0x04,0x00,
-   0x03,0x53,0x04,0x00,
-   0x04,0x5E,0x04,0x00,
-   0x04,0x69,0x04,0x00,
-   0x03,0x74,0x04,0x00,
-   0x04,0x7F,0x04,0x00,
-   0x04,0x8A,0x04,0x00,
-   0x03,0x95,0x04,0x00,
-   0x04,0xA0,0x04,0x00,
-   0x04,0xAB,0x04,0x00,
-   0x01,0xB6,0x04,0x00,
-   0x02,0xC1,0x04,0x00,
-   0x04,0xCC,0x04,0x00,
-   0x01,0xD7,0x04,0x00,
-   0x07,0xE2,0x04,0x00,
-   0x04,0xED,0x04,0x00,
-   0x04,0xF8,0x04,0x00,
-   0x04,0x03,0x05,0x00,
-   0x04,0x0E,0x05,0x00,
-   0x03,0x19,0x05,0x00,
-   0x03,0x24,0x05,0x00,
-   0x02,0x2F,0x05,0x00,
-   0x04,0x3A,0x05,0x00,
-   0x05,0x45,0x05,0x00,
-   0x07,0x50,0x05,0x00,
-   0x03,0x5B,0x05,0x00,
-   0x05,0x66,0x05,0x00,
-   0x03,0x71,0x05,0x00,
-   0x03,0x7C,0x05,0x00,
-   0x02,0x87,0x05,0x00,
-   0x03,0x92,0x05,0x00,
-   0x06,0x9D,0x05,0x00,
-   0x02,0xA8,0x05,0x00,
-   0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,                          # Code for char num 32
-   0x00,0x00,0x01,0x01,0x01,0x01,0x01,0x00,0x01,0x00,0x00,                          # Code for char num 33
-   0x00,0x05,0x05,0x05,0x00,0x00,0x00,0x00,0x00,0x00,0x00,                          # Code for char num 34
-   0x00,0x00,0x24,0x24,0x7E,0x14,0x3F,0x12,0x12,0x00,0x00,                          # Code for char num 35
-   0x00,0x00,0x04,0x1E,0x05,0x06,0x0C,0x14,0x0F,0x04,0x04,                          # Code for char num 36
-   0x00,0x00,0x00,0x00,0x46,0x00,0x29,0x00,0x29,0x00,0xD6,0x00,0x28,0x01,0x28,0x01,0xC4,0x00,0x00,0x00,0x00,0x00, # Code for char num 37
-   0x00,0x00,0x06,0x09,0x09,0x16,0x09,0x19,0x26,0x00,0x00,                          # Code for char num 38
-   0x00,0x01,0x01,0x01,0x00,0x00,0x00,0x00,0x00,0x00,0x00,                          # Code for char num 39
-   0x00,0x04,0x02,0x01,0x01,0x01,0x01,0x01,0x01,0x02,0x04,                          # Code for char num 40
-   0x00,0x00,0x01,0x02,0x02,0x02,0x02,0x02,0x02,0x01,0x00,                          # Code for char num 41
-   0x04,0x15,0x0E,0x15,0x04,0x00,0x00,0x00,0x00,0x00,0x00,                          # Code for char num 42
-   0x00,0x00,0x00,0x08,0x08,0x3E,0x08,0x08,0x00,0x00,0x00,                          # Code for char num 43
-   0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x02,0x02,0x01,0x00,                          # Code for char num 44
-   0x00,0x00,0x00,0x00,0x00,0x00,0x03,0x00,0x00,0x00,0x00,                          # Code for char num 45
-   0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x02,0x02,0x00,0x00,                          # Code for char num 46
-   0x00,0x04,0x04,0x02,0x02,0x02,0x02,0x02,0x01,0x01,0x00,                          # Code for char num 47
-   0x00,0x00,0x06,0x09,0x09,0x09,0x09,0x09,0x06,0x00,0x00,                          # Code for char num 48
-   0x00,0x00,0x04,0x06,0x04,0x04,0x04,0x04,0x0E,0x00,0x00,                          # Code for char num 49
-   0x00,0x00,0x07,0x08,0x08,0x04,0x02,0x01,0x0F,0x00,0x00,                          # Code for char num 50
-   0x00,0x00,0x07,0x08,0x08,0x06,0x08,0x08,0x07,0x00,0x00,                          # Code for char num 51
-   0x00,0x00,0x08,0x0C,0x0A,0x09,0x1F,0x08,0x08,0x00,0x00,                          # Code for char num 52
-   0x00,0x00,0x0F,0x01,0x01,0x07,0x08,0x08,0x07,0x00,0x00,                          # Code for char num 53
-   0x00,0x00,0x06,0x01,0x01,0x07,0x09,0x09,0x06,0x00,0x00,                          # Code for char num 54
-   0x00,0x00,0x0F,0x08,0x04,0x04,0x02,0x02,0x01,0x00,0x00,                          # Code for char num 55
-   0x00,0x00,0x06,0x09,0x09,0x06,0x09,0x09,0x06,0x00,0x00,                          # Code for char num 56
-   0x00,0x00,0x06,0x09,0x09,0x0E,0x08,0x08,0x06,0x00,0x00,                          # Code for char num 57
-   0x00,0x00,0x00,0x00,0x02,0x02,0x00,0x02,0x02,0x00,0x00,                          # Code for char num 58
-   0x00,0x00,0x00,0x00,0x02,0x02,0x00,0x02,0x02,0x01,0x00,                          # Code for char num 59
-   0x00,0x00,0x00,0x00,0x20,0x1C,0x02,0x1C,0x20,0x00,0x00,                          # Code for char num 60
-   0x00,0x00,0x00,0x00,0x00,0x3F,0x00,0x3F,0x00,0x00,0x00,                          # Code for char num 61
-   0x00,0x00,0x00,0x00,0x02,0x1C,0x20,0x1C,0x02,0x00,0x00,                          # Code for char num 62
-   0x00,0x00,0x07,0x08,0x08,0x04,0x02,0x00,0x02,0x00,0x00,                          # Code for char num 63
-   0x00,0x00,0x1C,0x22,0x59,0x55,0x55,0x39,0x02,0x1C,0x00,                          # Code for char num 64
-   0x00,0x00,0x0C,0x0C,0x12,0x12,0x3F,0x21,0x21,0x00,0x00,                          # Code for char num 65
-   0x00,0x00,0x07,0x09,0x09,0x0F,0x11,0x11,0x0F,0x00,0x00,                          # Code for char num 66
-   0x00,0x00,0x1C,0x22,0x01,0x01,0x01,0x22,0x1C,0x00,0x00,                          # Code for char num 67
-   0x00,0x00,0x0F,0x11,0x21,0x21,0x21,0x11,0x0F,0x00,0x00,                          # Code for char num 68
-   0x00,0x00,0x1F,0x01,0x01,0x0F,0x01,0x01,0x1F,0x00,0x00,                          # Code for char num 69
-   0x00,0x00,0x1F,0x01,0x01,0x0F,0x01,0x01,0x01,0x00,0x00,                          # Code for char num 70
-   0x00,0x00,0x1C,0x22,0x01,0x39,0x21,0x22,0x3C,0x00,0x00,                          # Code for char num 71
-   0x00,0x00,0x21,0x21,0x21,0x3F,0x21,0x21,0x21,0x00,0x00,                          # Code for char num 72
-   0x00,0x00,0x07,0x02,0x02,0x02,0x02,0x02,0x07,0x00,0x00,                          # Code for char num 73
-   0x00,0x00,0x06,0x04,0x04,0x04,0x04,0x04,0x03,0x00,0x00,                          # Code for char num 74
-   0x00,0x00,0x11,0x09,0x05,0x03,0x05,0x09,0x11,0x00,0x00,                          # Code for char num 75
-   0x00,0x00,0x01,0x01,0x01,0x01,0x01,0x01,0x0F,0x00,0x00,                          # Code for char num 76
-   0x00,0x00,0x63,0x63,0x55,0x55,0x49,0x49,0x41,0x00,0x00,                          # Code for char num 77
-   0x00,0x00,0x21,0x23,0x25,0x29,0x31,0x21,0x21,0x00,0x00,                          # Code for char num 78
-   0x00,0x00,0x1C,0x22,0x41,0x41,0x41,0x22,0x1C,0x00,0x00,                          # Code for char num 79
-   0x00,0x00,0x0F,0x11,0x11,0x11,0x0F,0x01,0x01,0x00,0x00,                          # Code for char num 80
-   0x00,0x00,0x1C,0x22,0x41,0x41,0x41,0x22,0x1C,0x10,0x60,                          # Code for char num 81
-   0x00,0x00,0x0F,0x11,0x11,0x0F,0x05,0x09,0x11,0x00,0x00,                          # Code for char num 82
-   0x00,0x00,0x1E,0x01,0x01,0x0E,0x10,0x10,0x0F,0x00,0x00,                          # Code for char num 83
-   0x00,0x00,0x1F,0x04,0x04,0x04,0x04,0x04,0x04,0x00,0x00,                          # Code for char num 84
-   0x00,0x00,0x21,0x21,0x21,0x21,0x21,0x21,0x1E,0x00,0x00,                          # Code for char num 85
-   0x00,0x00,0x21,0x21,0x21,0x12,0x12,0x0C,0x0C,0x00,0x00,                          # Code for char num 86
-   0x00,0x00,0x49,0x49,0x55,0x55,0x55,0x22,0x22,0x00,0x00,                          # Code for char num 87
-   0x00,0x00,0x09,0x09,0x06,0x06,0x06,0x09,0x09,0x00,0x00,                          # Code for char num 88
-   0x00,0x00,0x11,0x0A,0x0A,0x04,0x04,0x04,0x04,0x00,0x00,                          # Code for char num 89
-   0x00,0x00,0x0F,0x08,0x04,0x02,0x02,0x01,0x0F,0x00,0x00,                          # Code for char num 90
-   0x00,0x03,0x01,0x01,0x01,0x01,0x01,0x01,0x01,0x01,0x03,                          # Code for char num 91
-   0x00,0x01,0x01,0x02,0x02,0x02,0x02,0x02,0x04,0x04,0x00,                          # Code for char num 92
-   0x00,0x03,0x02,0x02,0x02,0x02,0x02,0x02,0x02,0x02,0x03,                          # Code for char num 93
-   0x00,0x00,0x04,0x0A,0x11,0x00,0x00,0x00,0x00,0x00,0x00,                          # Code for char num 94
-   0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x1F,                          # Code for char num 95
-   0x00,0x02,0x04,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,                          # Code for char num 96
-   0x00,0x00,0x00,0x00,0x06,0x08,0x0E,0x09,0x0E,0x00,0x00,                          # Code for char num 97
-   0x00,0x01,0x01,0x01,0x07,0x09,0x09,0x09,0x07,0x00,0x00,                          # Code for char num 98
-   0x00,0x00,0x00,0x00,0x06,0x01,0x01,0x01,0x06,0x00,0x00,                          # Code for char num 99
-   0x00,0x08,0x08,0x08,0x0E,0x09,0x09,0x09,0x0E,0x00,0x00,                          # Code for char num 100
-   0x00,0x00,0x00,0x00,0x06,0x09,0x0F,0x01,0x0E,0x00,0x00,                          # Code for char num 101
-   0x00,0x06,0x01,0x01,0x07,0x01,0x01,0x01,0x01,0x00,0x00,                          # Code for char num 102
-   0x00,0x00,0x00,0x00,0x0E,0x09,0x09,0x09,0x0E,0x08,0x06,                          # Code for char num 103
-   0x00,0x01,0x01,0x01,0x07,0x09,0x09,0x09,0x09,0x00,0x00,                          # Code for char num 104
-   0x00,0x00,0x01,0x00,0x01,0x01,0x01,0x01,0x01,0x00,0x00,                          # Code for char num 105
-   0x00,0x00,0x02,0x00,0x03,0x02,0x02,0x02,0x02,0x02,0x01,                          # Code for char num 106
-   0x00,0x01,0x01,0x01,0x09,0x05,0x03,0x05,0x09,0x00,0x00,                          # Code for char num 107
-   0x00,0x01,0x01,0x01,0x01,0x01,0x01,0x01,0x01,0x00,0x00,                          # Code for char num 108
-   0x00,0x00,0x00,0x00,0x37,0x49,0x49,0x49,0x49,0x00,0x00,                          # Code for char num 109
-   0x00,0x00,0x00,0x00,0x07,0x09,0x09,0x09,0x09,0x00,0x00,                          # Code for char num 110
-   0x00,0x00,0x00,0x00,0x06,0x09,0x09,0x09,0x06,0x00,0x00,                          # Code for char num 111
-   0x00,0x00,0x00,0x00,0x07,0x09,0x09,0x09,0x07,0x01,0x01,                          # Code for char num 112
-   0x00,0x00,0x00,0x00,0x0E,0x09,0x09,0x09,0x0E,0x08,0x08,                          # Code for char num 113
-   0x00,0x00,0x00,0x00,0x05,0x03,0x01,0x01,0x01,0x00,0x00,                          # Code for char num 114
-   0x00,0x00,0x00,0x00,0x07,0x01,0x02,0x04,0x07,0x00,0x00,                          # Code for char num 115
-   0x00,0x00,0x00,0x01,0x03,0x01,0x01,0x01,0x02,0x00,0x00,                          # Code for char num 116
-   0x00,0x00,0x00,0x00,0x09,0x09,0x09,0x09,0x0E,0x00,0x00,                          # Code for char num 117
-   0x00,0x00,0x00,0x00,0x11,0x0A,0x0A,0x0A,0x04,0x00,0x00,                          # Code for char num 118
-   0x00,0x00,0x00,0x00,0x49,0x49,0x55,0x36,0x22,0x00,0x00,                          # Code for char num 119
-   0x00,0x00,0x00,0x00,0x05,0x02,0x02,0x02,0x05,0x00,0x00,                          # Code for char num 120
-   0x00,0x00,0x00,0x00,0x11,0x0A,0x0A,0x0A,0x04,0x04,0x02,                          # Code for char num 121
-   0x00,0x00,0x00,0x00,0x07,0x04,0x02,0x01,0x07,0x00,0x00,                          # Code for char num 122
-   0x00,0x04,0x02,0x02,0x02,0x02,0x01,0x02,0x02,0x02,0x04,                          # Code for char num 123
-   0x00,0x02,0x02,0x02,0x02,0x02,0x02,0x02,0x02,0x02,0x02,                          # Code for char num 124
-   0x00,0x01,0x02,0x02,0x02,0x02,0x04,0x02,0x02,0x02,0x01,                          # Code for char num 125
-   0x00,0x00,0x00,0x00,0x00,0x26,0x19,0x00,0x00,0x00,0x00,                          # Code for char num 126
-   0x00,0x00,0x00,0x03,0x03,0x03,0x03,0x03,0x00,0x00,0x00
-]
+# Fonts are stored as bytes so that the glyph data stays in flash and is indexed in place.
+# Layout: 2 reserved bytes, first char (16 bit LE), last char (16 bit LE), height, 1 reserved byte,
+# then 4 bytes per char (width, 24 bit LE offset of the bitmap) followed by the bitmaps,
+# one row per ceil(width/8) bytes, LSB first.
+#
+# Fonts given as lists of ints with the same layout are still accepted by the driver.
+
+guiFont_Tahoma_7_Regular = (
+   b"\x00"
+   b"\x00"
+   b"\x20\x00"
+   b"\x7F\x00"
+   b"\x0B"
+   b"\x10"
+   b"\x03\x88\x01\x00"
+   b"\x01\x93\x01\x00"
+   b"\x03\x9E\x01\x00"
+   b"\x07\xA9\x01\x00"
+   b"\x05\xB4\x01\x00"
+   b"\x09\xBF\x01\x00"
+   b"\x06\xD5\x01\x00"
+   b"\x01\xE0\x01\x00"
+   b"\x03\xEB\x01\x00"
+   b"\x02\xF6\x01\x00"
+   b"\x05\x01\x02\x00"
+   b"\x06\x0C\x02\x00"
+   b"\x02\x17\x02\x00"
+   b"\x02\x22\x02\x00"
+   b"\x02\x2D\x02\x00"
+   b"\x03\x38\x02\x00"
+   b"\x04\x43\x02\x00"
+   b"\x04\x4E\x02\x00"
+   b"\x04\x59\x02\x00"
+   b"\x04\x64\x02\x00"
+   b"\x05\x6F\x02\x00"
+   b"\x04\x7A\x02\x00"
+   b"\x04\x85\x02\x00"
+   b"\x04\x90\x02\x00"
+   b"\x04\x9B\x02\x00"
+   b"\x04\xA6\x02\x00"
+   b"\x02\xB1\x02\x00"
+   b"\x02\xBC\x02\x00"
+   b"\x06\xC7\x02\x00"
+   b"\x06\xD2\x02\x00"
+   b"\x06\xDD\x02\x00"
+   b"\x04\xE8\x02\x00"
+   b"\x07\xF3\x02\x00"
+   b"\x06\xFE\x02\x00"
+   b"\x05\x09\x03\x00"
+   b"\x06\x14\x03\x00"
+   b"\x06\x1F\x03\x00"
+   b"\x05\x2A\x03\x00"
+   b"\x05\x35\x03\x00"
+   b"\x06\x40\x03\x00"
+   b"\x06\x4B\x03\x00"
+   b"\x03\x56\x03\x00"
+   b"\x03\x61\x03\x00"
+   b"\x05\x6C\x03\x00"
+   b"\x04\x77\x03\x00"
+   b"\x07\x82\x03\x00"
+   b"\x06\x8D\x03\x00"
+   b"\x07\x98\x03\x00"
+   b"\x05\xA3\x03\x00"
+   b"\x07\xAE\x03\x00"
+   b"\x05\xB9\x03\x00"
+   b"\x05\xC4\x03\x00"
+   b"\x05\xCF\x03\x00"
+   b"\x06\xDA\x03\x00"
+   b"\x06\xE5\x03\x00"
+   b"\x07\xF0\x03\x00"
+   b"\x04\xFB\x03\x00"
+   b"\x05\x06\x04\x00"
+   b"\x04\x11\x04\x00"
+   b"\x02\x1C\x04\x00"
+   b"\x03\x27\x04\x00"
+   b"\x02\x32\x04\x00"
+   b"\x05\x3D\x04\x00"
+   b"\x05\x48\x04\x00"
+   b"\x03\x53\x04\x00"
+   b"\x04\x5E\x04\x00"
+   b"\x04\x69\x04\x00"
+   b"\x03\x74\x04\x00"
+   b"\x04\x7F\x04\x00"
+   b"\x04\x8A\x04\x00"
+   b"\x03\x95\x04\x00"
+   b"\x04\xA0\x04\x00"
+   b"\x04\xAB\x04\x00"
+   b"\x01\xB6\x04\x00"
+   b"\x02\xC1\x04\x00"
+   b"\x04\xCC\x04\x00"
+   b"\x01\xD7\x04\x00"
+   b"\x07\xE2\x04\x00"
+   b"\x04\xED\x04\x00"
+   b"\x04\xF8\x04\x00"
+   b"\x04\x03\x05\x00"
+   b"\x04\x0E\x05\x00"
+   b"\x03\x19\x05\x00"
+   b"\x03\x24\x05\x00"
+   b"\x02\x2F\x05\x00"
+   b"\x04\x3A\x05\x00"
+   b"\x05\x45\x05\x00"
+   b"\x07\x50\x05\x00"
+   b"\x03\x5B\x05\x00"
+   b"\x05\x66\x05\x00"
+   b"\x03\x71\x05\x00"
+   b"\x03\x7C\x05\x00"
+   b"\x02\x87\x05\x00"
+   b"\x03\x92\x05\x00"
+   b"\x06\x9D\x05\x00"
+   b"\x02\xA8\x05\x00"
+   b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"                          # Code for char num 32
+   b"\x00\x00\x01\x01\x01\x01\x01\x00\x01\x00\x00"                          # Code for char num 33
+   b"\x00\x05\x05\x05\x00\x00\x00\x00\x00\x00\x00"                          # Code for char num 34
+   b"\x00\x00\x24\x24\x7E\x14\x3F\x12\x12\x00\x00"                          # Code for char num 35
+   b"\x00\x00\x04\x1E\x05\x06\x0C\x14\x0F\x04\x04"                          # Code for char num 36
+   b"\x00\x00\x00\x00\x46\x00\x29\x00\x29\x00\xD6\x00\x28\x01\x28\x01\xC4\x00\x00\x00\x00\x00" # Code for char num 37
+   b"\x00\x00\x06\x09\x09\x16\x09\x19\x26\x00\x00"                          # Code for char num 38
+   b"\x00\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00"                          # Code for char num 39
+   b"\x00\x04\x02\x01\x01\x01\x01\x01\x01\x02\x04"                          # Code for char num 40
+   b"\x00\x00\x01\x02\x02\x02\x02\x02\x02\x01\x00"                          # Code for char num 41
+   b"\x04\x15\x0E\x15\x04\x00\x00\x00\x00\x00\x00"                          # Code for char num 42
+   b"\x00\x00\x00\x08\x08\x3E\x08\x08\x00\x00\x00"                          # Code for char num 43
+   b"\x00\x00\x00\x00\x00\x00\x00\x02\x02\x01\x00"                          # Code for char num 44
+   b"\x00\x00\x00\x00\x00\x00\x03\x00\x00\x00\x00"                          # Code for char num 45
+   b"\x00\x00\x00\x00\x00\x00\x00\x02\x02\x00\x00"                          # Code for char num 46
+   b"\x00\x04\x04\x02\x02\x02\x02\x02\x01\x01\x00"                          # Code for char num 47
+   b"\x00\x00\x06\x09\x09\x09\x09\x09\x06\x00\x00"                          # Code for char num 48
+   b"\x00\x00\x04\x06\x04\x04\x04\x04\x0E\x00\x00"                          # Code for char num 49
+   b"\x00\x00\x07\x08\x08\x04\x02\x01\x0F\x00\x00"                          # Code for char num 50
+   b"\x00\x00\x07\x08\x08\x06\x08\x08\x07\x00\x00"                          # Code for char num 51
+   b"\x00\x00\x08\x0C\x0A\x09\x1F\x08\x08\x00\x00"                          # Code for char num 52
+   b"\x00\x00\x0F\x01\x01\x07\x08\x08\x07\x00\x00"                          # Code for char num 53
+   b"\x00\x00\x06\x01\x01\x07\x09\x09\x06\x00\x00"                          # Code for char num 54
+   b"\x00\x00\x0F\x08\x04\x04\x02\x02\x01\x00\x00"                          # Code for char num 55
+   b"\x00\x00\x06\x09\x09\x06\x09\x09\x06\x00\x00"                          # Code for char num 56
+   b"\x00\x00\x06\x09\x09\x0E\x08\x08\x06\x00\x00"                          # Code for char num 57
+   b"\x00\x00\x00\x00\x02\x02\x00\x02\x02\x00\x00"                          # Code for char num 58
+   b"\x00\x00\x00\x00\x02\x02\x00\x02\x02\x01\x00"                          # Code for char num 59
+   b"\x00\x00\x00\x00\x20\x1C\x02\x1C\x20\x00\x00"                          # Code for char num 60
+   b"\x00\x00\x00\x00\x00\x3F\x00\x3F\x00\x00\x00"                          # Code for char num 61
+   b"\x00\x00\x00\x00\x02\x1C\x20\x1C\x02\x00\x00"                          # Code for char num 62
+   b"\x00\x00\x07\x08\x08\x04\x02\x00\x02\x00\x00"                          # Code for char num 63
+   b"\x00\x00\x1C\x22\x59\x55\x55\x39\x02\x1C\x00"                          # Code for char num 64
+   b"\x00\x00\x0C\x0C\x12\x12\x3F\x21\x21\x00\x00"                          # Code for char num 65
+   b"\x00\x00\x07\x09\x09\x0F\x11\x11\x0F\x00\x00"                          # Code for char num 66
+   b"\x00\x00\x1C\x22\x01\x01\x01\x22\x1C\x00\x00"                          # Code for char num 67
+   b"\x00\x00\x0F\x11\x21\x21\x21\x11\x0F\x00\x00"                          # Code for char num 68
+   b"\x00\x00\x1F\x01\x01\x0F\x01\x01\x1F\x00\x00"                          # Code for char num 69
+   b"\x00\x00\x1F\x01\x01\x0F\x01\x01\x01\x00\x00"                          # Code for char num 70
+   b"\x00\x00\x1C\x22\x01\x39\x21\x22\x3C\x00\x00"                          # Code for char num 71
+   b"\x00\x00\x21\x21\x21\x3F\x21\x21\x21\x00\x00"                          # Code for char num 72
+   b"\x00\x00\x07\x02\x02\x02\x02\x02\x07\x00\x00"                          # Code for char num 73
+   b"\x00\x00\x06\x04\x04\x04\x04\x04\x03\x00\x00"                          # Code for char num 74
+   b"\x00\x00\x11\x09\x05\x03\x05\x09\x11\x00\x00"                          # Code for char num 75
+   b"\x00\x00\x01\x01\x01\x01\x01\x01\x0F\x00\x00"                          # Code for char num 76
+   b"\x00\x00\x63\x63\x55\x55\x49\x49\x41\x00\x00"                          # Code for char num 77
+   b"\x00\x00\x21\x23\x25\x29\x31\x21\x21\x00\x00"                          # Code for char num 78
+   b"\x00\x00\x1C\x22\x41\x41\x41\x22\x1C\x00\x00"                          # Code for char num 79
+   b"\x00\x00\x0F\x11\x11\x11\x0F\x01\x01\x00\x00"                          # Code for char num 80
+   b"\x00\x00\x1C\x22\x41\x41\x41\x22\x1C\x10\x60"                          # Code for char num 81
+   b"\x00\x00\x0F\x11\x11\x0F\x05\x09\x11\x00\x00"                          # Code for char num 82
+   b"\x00\x00\x1E\x01\x01\x0E\x10\x10\x0F\x00\x00"                          # Code for char num 83
+   b"\x00\x00\x1F\x04\x04\x04\x04\x04\x04\x00\x00"                          # Code for char num 84
+   b"\x00\x00\x21\x21\x21\x21\x21\x21\x1E\x00\x00"                          # Code for char num 85
+   b"\x00\x00\x21\x21\x21\x12\x12\x0C\x0C\x00\x00"                          # Code for char num 86
+   b"\x00\x00\x49\x49\x55\x55\x55\x22\x22\x00\x00"                          # Code for char num 87
+   b"\x00\x00\x09\x09\x06\x06\x06\x09\x09\x00\x00"                          # Code for char num 88
+   b"\x00\x00\x11\x0A\x0A\x04\x04\x04\x04\x00\x00"                          # Code for char num 89
+   b"\x00\x00\x0F\x08\x04\x02\x02\x01\x0F\x00\x00"                          # Code for char num 90
+   b"\x00\x03\x01\x01\x01\x01\x01\x01\x01\x01\x03"                          # Code for char num 91
+   b"\x00\x01\x01\x02\x02\x02\x02\x02\x04\x04\x00"                          # Code for char num 92
+   b"\x00\x03\x02\x02\x02\x02\x02\x02\x02\x02\x03"                          # Code for char num 93
+   b"\x00\x00\x04\x0A\x11\x00\x00\x00\x00\x00\x00"                          # Code for char num 94
+   b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1F"                          # Code for char num 95
+   b"\x00\x02\x04\x00\x00\x00\x00\x00\x00\x00\x00"                          # Code for char num 96
+   b"\x00\x00\x00\x00\x06\x08\x0E\x09\x0E\x00\x00"                          # Code for char num 97
+   b"\x00\x01\x01\x01\x07\x09\x09\x09\x07\x00\x00"                          # Code for char num 98
+   b"\x00\x00\x00\x00\x06\x01\x01\x01\x06\x00\x00"                          # Code for char num 99
+   b"\x00\x08\x08\x08\x0E\x09\x09\x09\x0E\x00\x00"                          # Code for char num 100
+   b"\x00\x00\x00\x00\x06\x09\x0F\x01\x0E\x00\x00"                          # Code for char num 101
+   b"\x00\x06\x01\x01\x07\x01\x01\x01\x01\x00\x00"                          # Code for char num 102
+   b"\x00\x00\x00\x00\x0E\x09\x09\x09\x0E\x08\x06"                          # Code for char num 103
+   b"\x00\x01\x01\x01\x07\x09\x09\x09\x09\x00\x00"                          # Code for char num 104
+   b"\x00\x00\x01\x00\x01\x01\x01\x01\x01\x00\x00"                          # Code for char num 105
+   b"\x00\x00\x02\x00\x03\x02\x02\x02\x02\x02\x01"                          # Code for char num 106
+   b"\x00\x01\x01\x01\x09\x05\x03\x05\x09\x00\x00"                          # Code for char num 107
+   b"\x00\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00"                          # Code for char num 108
+   b"\x00\x00\x00\x00\x37\x49\x49\x49\x49\x00\x00"                          # Code for char num 109
+   b"\x00\x00\x00\x00\x07\x09\x09\x09\x09\x00\x00"                          # Code for char num 110
+   b"\x00\x00\x00\x00\x06\x09\x09\x09\x06\x00\x00"                          # Code for char num 111
+   b"\x00\x00\x00\x00\x07\x09\x09\x09\x07\x01\x01"                          # Code for char num 112
+   b"\x00\x00\x00\x00\x0E\x09\x09\x09\x0E\x08\x08"                          # Code for char num 113
+   b"\x00\x00\x00\x00\x05\x03\x01\x01\x01\x00\x00"                          # Code for char num 114
+   b"\x00\x00\x00\x00\x07\x01\x02\x04\x07\x00\x00"                          # Code for char num 115
+   b"\x00\x00\x00\x01\x03\x01\x01\x01\x02\x00\x00"                          # Code for char num 116
+   b"\x00\x00\x00\x00\x09\x09\x09\x09\x0E\x00\x00"                          # Code for char num 117
+   b"\x00\x00\x00\x00\x11\x0A\x0A\x0A\x04\x00\x00"                          # Code for char num 118
+   b"\x00\x00\x00\x00\x49\x49\x55\x36\x22\x00\x00"                          # Code for char num 119
+   b"\x00\x00\x00\x00\x05\x02\x02\x02\x05\x00\x00"                          # Code for char num 120
+   b"\x00\x00\x00\x00\x11\x0A\x0A\x0A\x04\x04\x02"                          # Code for char num 121
+   b"\x00\x00\x00\x00\x07\x04\x02\x01\x07\x00\x00"                          # Code for char num 122
+   b"\x00\x04\x02\x02\x02\x02\x01\x02\x02\x02\x04"                          # Code for char num 123
+   b"\x00\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02"                          # Code for char num 124
+   b"\x00\x01\x02\x02\x02\x02\x04\x02\x02\x02\x01"                          # Code for char num 125
+   b"\x00\x00\x00\x00\x00\x26\x19\x00\x00\x00\x00"                          # Code for char num 126
+   b"\x00\x00\x00\x03\x03\x03\x03\x03\x00\x00\x00"
+)
@@ -17,6 +17,9 @@ raise UnsupportedError
 #-endif
 
 
+import threading
+import timers
+
 #-if SSD1306SPI
 import spi
 #-else
@@ -66,6 +69,22 @@ LEFT_HORIZONTAL_SCROLL               = 0x27
 VERTICAL_AND_RIGHT_HORIZONTAL_SCROLL = 0x29
 VERTICAL_AND_LEFT_HORIZONTAL_SCROLL  = 0x2A
 
+# Fade out and blinking constants
+SET_FADE_BLINK                       = 0x23
+
+OLED_FADE_OFF           = 0x00
+OLED_FADE_OUT           = 0x20
+OLED_FADE_BLINK         = 0x30
+
+# minimum interval between two contrast steps of fade(), in ms
+_FADE_PERIOD = 10
+
+OLED_SCROLL_RIGHT       = 0
+OLED_SCROLL_LEFT        = 1
+
+# scroll step interval in frames, indexed by the 3 bit code of the scroll commands
+_SCROLL_FRAMES = [5, 64, 128, 256, 3, 4, 25, 2]
+
 OLED_TEXT_ALIGN_NONE    = 0
 OLED_TEXT_ALIGN_LEFT    = 0x1
 OLED_TEXT_ALIGN_RIGHT   = 0x2
@@ -74,6 +93,23 @@ OLED_TEXT_VALIGN_TOP    = 0x10
 OLED_TEXT_VALIGN_BOTTOM = 0x20
 OLED_TEXT_VALIGN_CENTER = 0x30
 
+# masks of the rows of a page from bit n down to the bottom, and from the top down to bit n
+_MASK_FROM = b"\xFF\xFE\xFC\xF8\xF0\xE0\xC0\x80"
+_MASK_TO   = b"\x01\x03\x07\x0F\x1F\x3F\x7F\xFF"
+
+# indexes of the bus counters, see stats()
+_STAT_COMMANDS     = 0
+_STAT_DATA         = 1
+_STAT_TRANSACTIONS = 2
+_STAT_FLUSHES      = 3
+_STAT_BUS_TIME     = 4
+_STAT_SKIPPED      = 5
+
+OLED_BLIT_OR      = 0
+OLED_BLIT_AND_NOT = 1
+OLED_BLIT_XOR     = 2
+OLED_BLIT_COPY    = 3
+
 OLED_TEXT_ALIGN = [
     OLED_TEXT_ALIGN_NONE,
     OLED_TEXT_ALIGN_LEFT,
@@ -84,6 +120,79 @@ OLED_TEXT_ALIGN = [
     OLED_TEXT_VALIGN_CENTER
 ]
 
+# Glyph cache
+#
+# Glyphs are rasterized once into the panel's native page layout (one byte per column
+# for each 8 pixel rows, LSB on top) and kept in a bounded LRU cache shared by all the
+# displays. Keys combine the font slot in _glyph_fonts with the char table index.
+GLYPH_CACHE_SIZE = 64
+
+_glyph_fonts = []
+_glyph_cache = {}
+_glyph_lru = []
+
+def _font_id(font):
+    for i in range(len(_glyph_fonts)):
+        if _glyph_fonts[i] is font:
+            return i
+    _glyph_fonts.append(font)
+    return len(_glyph_fonts)-1
+
+def _get_glyph(font, font_id, idx, height):
+    key = (font_id << 16) | idx
+    if key in _glyph_cache:
+        if _glyph_lru[-1] != key:
+            _glyph_lru.remove(key)
+            _glyph_lru.append(key)
+        return _glyph_cache[key]
+    c_width = font[idx]
+    offset = font[idx+1] | (font[idx+2] << 8) | (font[idx+3] << 16)
+    # font rows are stored top to bottom, LSB first, padded to whole bytes
+    row_bytes = (c_width+7)>>3
+    glyph = bytearray(((height+7)>>3)*c_width)
+    for row in range(height):
+        bit = 1 << (row & 7)
+        pos = (row>>3)*c_width
+        for col in range(c_width):
+            if font[offset + (col>>3)] & (1 << (col & 7)):
+                glyph[pos+col] |= bit
+        offset += row_bytes
+    if len(_glyph_lru) >= GLYPH_CACHE_SIZE:
+        del _glyph_cache[_glyph_lru.pop(0)]
+    _glyph_cache[key] = glyph
+    _glyph_lru.append(key)
+    return glyph
+
+# Text measurements
+#
+# Widths of strings and line layouts of text boxes are cached by string, tagged with the
+# font slot (and the box width for layouts) so that stale entries are recomputed.
+# Caches are emptied when full: texts drawn repeatedly are measured again at most once
+TEXT_CACHE_SIZE = 32
+_width_cache = {}
+_layout_cache = {}
+
+def _blit_glyph(dst, stride, glyph, c_width, height, x, y, fill):
+    # OR (fill) or clear (not fill) the glyph columns into a page buffer of the given
+    # stride, shifted down by the row offset of y inside its page
+    shift = y & 7
+    for gpage in range((height+7)>>3):
+        pos = ((y>>3) + gpage)*stride + x
+        g = gpage*c_width
+        for col in range(c_width):
+            bits = glyph[g+col]
+            if bits:
+                lo = (bits << shift) & 0xFF
+                hi = bits >> (8-shift)
+                if fill:
+                    dst[pos+col] |= lo
+                    if hi:
+                        dst[pos+stride+col] |= hi
+                else:
+                    dst[pos+col] &= ~lo & 0xFF
+                    if hi:
+                        dst[pos+stride+col] &= ~hi & 0xFF
+
 
 #-if SSD1306SPI
 class SSD1306(spi.Spi):
@@ -118,15 +227,15 @@ class SSD1306(spi.Spi):
         pinMode(self.rst,OUTPUT)
         self._reset()
         self.font_init = False
-        self.dynamic_area = {
-            "x": 0,
-            "y": 0,
-            "width": 0,
-            "height": 0,
-            "buffer": None
-        }
+        self._bus_lock = threading.Lock()
+        self._dirty_lock = threading.Lock()
+        self._flush_request = None
+        self._fps_period = 0
+        self._fps_gen = 0
+        self._stats = None
+        self._stats_hook = None
+        self._fade_gen = 0
         self.buf = bytearray(1)
-        self.c_buf = None
 
     def _command(self,cmd):
         self.select()
@@ -135,14 +244,37 @@ class SSD1306(spi.Spi):
         self.write(self.buf)
         self.unselect()
 
-    def _send_data(self):
-        for page in range(0,self._screen_pages):
-            self._set_column(self._column_offset)
-            self._set_page(page)            
-            self.select()
-            digitalWrite(self.dc,1)
-            self.write(self._buf_display[page*self._screen_width:((page+1)*self._screen_width)])
-            self.unselect()
+    def _commands(self, seq):
+        self.select()
+        digitalWrite(self.dc,0)
+        self.write(seq)
+        self.unselect()
+
+    def _write_window(self, buf, x0, x1, p0, p1):
+        # one burst with DC held high: the window rows are either contiguous in the
+        # frame buffer (full width) or sent back to back without releasing CS
+        # returns the number of bus writes
+        w = self._screen_width
+        self.select()
+        digitalWrite(self.dc,1)
+        n = 1
+        if x0 == 0 and x1 == w-1:
+            if p0 == 0 and p1 == self._screen_pages-1:
+                self.write(buf)
+            else:
+                self.write(buf[p0*w:(p1+1)*w])
+        else:
+            for page in range(p0, p1+1):
+                self.write(buf[page*w+x0:page*w+x1+1])
+            n = p1-p0+1
+        self.unselect()
+        return n
+
+    def _write_data(self, data):
+        self.select()
+        digitalWrite(self.dc,1)
+        self.write(data)
+        self.unselect()
             
     def _reset(self):
         digitalWrite(self.rst,0)
@@ -186,31 +318,71 @@ class SSD1306(i2c.I2C):
             pinMode(self.rst,OUTPUT)
             self._reset()
         self.font_init = False
-        self.dynamic_area = {
-            "x": 0,
-            "y": 0,
-            "width": 0,
-            "height": 0,
-            "buffer": None
-        }
-        self.buf = bytearray(1)
-        self.c_buf = None
+        self._bus_lock = threading.Lock()
+        self._dirty_lock = threading.Lock()
+        self._flush_request = None
+        self._fps_period = 0
+        self._fps_gen = 0
+        self._stats = None
+        self._stats_hook = None
+        self._fade_gen = 0
+        self.buf = bytearray(2)
+        self.buf[0] = COMMAND_CODE
+        self._cmd_bufs = {}
+        self._tx = None
 
     def _command(self, cmd):
-        self.buf[0]=cmd
-        _to_send = bytearray(2)
-        _to_send[0]=COMMAND_CODE
-        _to_send[1]=self.buf[0]
+        self.buf[1]=cmd
+        self.write(self.buf)
+
+    def _commands(self, seq):
+        # a single control byte (Co=0, D/C#=0) followed by the whole command stream;
+        # one transfer buffer is kept per sequence length, so the window and contrast
+        # commands sent at every flush or fade step don't allocate
+        n = len(seq)+1
+        _to_send = self._cmd_bufs.get(n)
+        if _to_send is None:
+            _to_send = bytearray(n)
+            _to_send[0] = COMMAND_CODE
+            self._cmd_bufs[n] = _to_send
+        _to_send[1:] = seq
         self.write(_to_send)
 
-    def _send_data(self):
-        _to_send=bytearray(self._screen_width + 1)
-        _to_send[0]=DATA_CODE
-        for page in range(0,self._screen_pages):
-            self._set_column(self._column_offset)
-            self._set_page(page)
-            _to_send[1:]=self._buf_display[page*self._screen_width:((page+1)*self._screen_width)]
-            self.write(_to_send)
+    def _write_window(self, buf, x0, x1, p0, p1):
+        # the whole window goes out in a single transaction after one DATA_CODE byte;
+        # the transfer buffer is allocated once, sized for the full frame
+        w = self._screen_width
+        self._alloc_tx()
+        n = (x1-x0+1)*(p1-p0+1)+1
+        if x0 == 0 and x1 == w-1:
+            if n == len(self._tx):
+                self._tx[1:] = buf
+            else:
+                self._tx[1:n] = buf[p0*w:(p1+1)*w]
+        else:
+            pos = 1
+            for page in range(p0, p1+1):
+                self._tx[pos:pos+x1-x0+1] = buf[page*w+x0:page*w+x1+1]
+                pos += x1-x0+1
+        if n == len(self._tx):
+            self.write(self._tx)
+        else:
+            self.write(self._tx[0:n])
+        return 1
+
+    def _alloc_tx(self):
+        if self._tx is None or len(self._tx) != len(self._buf_display)+1:
+            self._tx = bytearray(len(self._buf_display)+1)
+            self._tx[0] = DATA_CODE
+
+    def _write_data(self, data):
+        self._alloc_tx()
+        n = len(data)+1
+        self._tx[1:n] = data
+        if n == len(self._tx):
+            self.write(self._tx)
+        else:
+            self.write(self._tx[0:n])
     
     def _reset(self):
         if self.rst is not None:
@@ -221,13 +393,161 @@ class SSD1306(i2c.I2C):
 ##-endif
 #-endif
 
-    def _set_page(self,page):
-        page=0xb0|page;
-        self._command(page)
+    def _set_window(self, x0, x1, p0, p1):
+        self._win_cmd[1] = self._column_offset+x0
+        self._win_cmd[2] = self._column_offset+x1
+        self._win_cmd[4] = p0
+        self._win_cmd[5] = p1
+        self._commands(self._win_cmd)
+
+    def _mark_dirty(self, x0, x1, p0, p1):
+        # grow the dirty bounding box (columns x0..x1, pages p0..p1, inclusive)
+        self._dirty_lock.acquire()
+        if x0 < self._dirty_x0:
+            self._dirty_x0 = x0
+        if x1 > self._dirty_x1:
+            self._dirty_x1 = x1
+        if p0 < self._dirty_p0:
+            self._dirty_p0 = p0
+        if p1 > self._dirty_p1:
+            self._dirty_p1 = p1
+        self._dirty_lock.release()
+
+    def _mark_all_dirty(self):
+        self._mark_dirty(0, self._screen_width-1, 0, self._screen_pages-1)
+
+    def _clear_dirty(self):
+        self._dirty_x0 = self._screen_width
+        self._dirty_x1 = -1
+        self._dirty_p0 = self._screen_pages
+        self._dirty_p1 = -1
+
+    def _take_dirty(self):
+        # return the dirty window (x0, x1, p0, p1) and reset it, or None if there is nothing
+        # to send; the lock keeps marks made by other threads from being lost in between.
+        # RAM can't be written while scrolling: the window is kept until stop_scroll()
+        win = None
+        self._dirty_lock.acquire()
+        if self._dirty_x0 <= self._dirty_x1 and not self._scrolling:
+            win = (self._dirty_x0, self._dirty_x1, self._dirty_p0, self._dirty_p1)
+            self._clear_dirty()
+        self._dirty_lock.release()
+        return win
+
+    def _send_data(self):
+        # send only the dirty window; in horizontal addressing mode the column pointer
+        # wraps to x0 and advances to the next page at the end of each row of the window,
+        # so the whole window is a single data burst after one window setup
+        win = self._take_dirty()
+        if win is not None:
+            self._send_window(self._buf_display, win[0], win[1], win[2], win[3])
+
+    # Bus transactions: the per-bus _command, _commands, _write_window and _write_data
+    # don't lock; these helpers hold the bus lock for a whole transaction, so that
+    # commands and flushes from different threads (including the flush thread) never interleave.
+    # They are also the only transfer paths, and feed the counters when stats are enabled:
+    # the list is read once per transaction, so disabled stats cost a single test
+
+    def _count(self, st, commands, data, transactions, t0):
+        st[_STAT_COMMANDS] += commands
+        st[_STAT_DATA] += data
+        st[_STAT_TRANSACTIONS] += transactions
+        st[_STAT_BUS_TIME] += timers.now()-t0
+
+    def _send_command(self, cmd):
+        st = self._stats
+        self._bus_lock.acquire()
+        try:
+            if st is not None:
+                t0 = timers.now()
+            self._command(cmd)
+            if st is not None:
+                self._count(st, 1, 0, 1, t0)
+        finally:
+            self._bus_lock.release()
+
+    def _send_commands(self, seq):
+        st = self._stats
+        self._bus_lock.acquire()
+        try:
+            if st is not None:
+                t0 = timers.now()
+            self._commands(seq)
+            if st is not None:
+                self._count(st, len(seq), 0, 1, t0)
+        finally:
+            self._bus_lock.release()
+
+    def _send_window(self, buf, x0, x1, p0, p1):
+        # frame flushes: the bytes of the frame left out of the window are counted as skipped
+        st = self._stats
+        self._bus_lock.acquire()
+        try:
+            if st is not None:
+                t0 = timers.now()
+            self._set_window(x0, x1, p0, p1)
+            n = self._write_window(buf, x0, x1, p0, p1)
+            if st is not None:
+                size = (x1-x0+1)*(p1-p0+1)
+                self._count(st, len(self._win_cmd), size, n+1, t0)
+                st[_STAT_FLUSHES] += 1
+                st[_STAT_SKIPPED] += len(buf)-size
+        finally:
+            self._bus_lock.release()
+        if st is not None and self._stats_hook is not None:
+            self._stats_hook(x0, x1, p0, p1, timers.now()-t0)
+
+    def _send_page_data(self, data, x0, x1, p0, p1):
+        st = self._stats
+        self._bus_lock.acquire()
+        try:
+            if st is not None:
+                t0 = timers.now()
+            self._set_window(x0, x1, p0, p1)
+            self._write_data(data)
+            if st is not None:
+                self._count(st, len(self._win_cmd), len(data), 2, t0)
+        finally:
+            self._bus_lock.release()
+
+    def _flush(self):
+        # with a frame rate limit the frame is sent by the scheduler thread
+        if self._auto_flush and not self._fps_period:
+            self._send_data()
+
+    def _fps_loop(self, gen):
+        # scheduler thread: at most one flush per period, merging everything drawn meanwhile;
+        # the next deadline is kept on a fixed grid so that slow transfers don't drift the rate
+        next_flush = timers.now()
+        while gen == self._fps_gen:
+            next_flush += self._fps_period
+            delay = next_flush - timers.now()
+            if delay > 0:
+                sleep(delay)
+            else:
+                next_flush = timers.now()
+            if gen == self._fps_gen:
+                self.show()
+
+    def _share_buffers(self, other):
+        # read-only fill rows and, on I2C, the transfer buffer are taken from another display
+        # of the same size; the transfer buffer is only used under the bus lock, shared too
+        if len(other._buf_display) != len(self._buf_display):
+            return
+        self._zeros = other._zeros
+        self._ones = other._ones
+#-if SSD1306I2C
+        other._alloc_tx()
+        self._tx = other._tx
+#-endif
 
-    def _set_column(self,col):
-        self._command(0x0f&col)
-        self._command(0x10|(col>>4))
+    def _flush_loop(self):
+        # flush thread: sends the front buffer window published by show()
+        while True:
+            self._flush_request.wait()
+            self._flush_request.clear()
+            self._send_window(self._front, self._front_x0, self._front_x1, self._front_p0, self._front_p1)
+            self._flush_done.set()
 
     def _check_coordinates(self,x,y,w,h):
         if x >= self._screen_width or y >= self._screen_height:
@@ -237,73 +557,175 @@ class SSD1306(i2c.I2C):
         if x+w > self._screen_width:
             raise ValueError
 
-    def _prepare(self,x,y,w,h,fill):
-        for page in range((y//8),((y+h-1)//8)+1):
-            if page == y//8 and page == ((y+h-1)//8):
-                bb = 0xFF << (y%8) & 0xFF
-                if (y+h)%8 != 0:
-                    bb &= 0xFF >> (8-((y+h)%8)) & 0xFF
-            elif page == y//8:
-                bb = 0xFF << (y%8) & 0xFF
-            elif page == ((y+h-1)//8) and (y+h)%8 != 0:
-                bb = 0xFF >> (8-((y+h)%8)) & 0xFF
-            else:
-                bb = 0xFF
-            if fill == False:
-                bb = ~bb&0xFF
-            count = 0
-            while count < w:
-                if fill == False:
-                    self._buf_display[(page*self._screen_width)+x+count] &= bb
+    def _fill_span(self, x, y, w, h, fill, no_alloc=False):
+        # full pages are written with a slice assignment, the partial first and last
+        # pages with the precomputed masks, OR-ed in or AND-ed out.
+        # Narrower full pages copy a slice of the row taken once per call; with no_alloc
+        # they are stored byte by byte instead (text backgrounds, drawn many times a
+        # second, must not allocate)
+        width = self._screen_width
+        p0 = y>>3
+        p1 = (y+h-1)>>3
+        row = self._ones if fill else self._zeros
+        if w != width and not no_alloc and h >= 8:
+            row = row[0:w]
+        for page in range(p0, p1+1):
+            bb = 0xFF
+            if page == p0:
+                bb = _MASK_FROM[y & 7]
+            if page == p1:
+                bb &= _MASK_TO[(y+h-1) & 7]
+            pos = page*width + x
+            if bb == 0xFF:
+                if len(row) == w:
+                    self._buf_display[pos:pos+w] = row
                 else:
-                    self._buf_display[(page*self._screen_width)+x+count] |= bb
-                count +=1
+                    v = row[0]
+                    for i in range(pos, pos+w):
+                        self._buf_display[i] = v
+            elif fill:
+                for i in range(pos, pos+w):
+                    self._buf_display[i] |= bb
+            else:
+                bb = ~bb & 0xFF
+                for i in range(pos, pos+w):
+                    self._buf_display[i] &= bb
+        self._mark_dirty(x, x+w-1, p0, p1)
+
+    def _apply(self, pos, v, mask, mode):
+        if mode == OLED_BLIT_OR:
+            self._buf_display[pos] |= v
+        elif mode == OLED_BLIT_AND_NOT:
+            self._buf_display[pos] &= ~v & 0xFF
+        elif mode == OLED_BLIT_XOR:
+            self._buf_display[pos] ^= v
+        else:
+            self._buf_display[pos] = (self._buf_display[pos] & ~mask & 0xFF) | v
+
+    def _blit_rows(self, src, x, y, w, h, mode):
+        # row-major 1bpp source (MSB is the leftmost pixel) is converted into page bytes
+        # one band of destination page at a time, then merged with a single write per column
+        row = (w+7)>>3
+        width = self._screen_width
+        r = 0
+        while r < h:
+            bit0 = (y+r) & 7
+            n = 8 - bit0
+            if r+n > h:
+                n = h-r
+            pos = ((y+r)>>3)*width + x
+            base = r*row
+            if n == 8:
+                # page aligned band: 8x8 transpose of each source byte column
+                for bx in range(row):
+                    b0 = src[base+bx]
+                    b1 = src[base+row+bx]
+                    b2 = src[base+2*row+bx]
+                    b3 = src[base+3*row+bx]
+                    b4 = src[base+4*row+bx]
+                    b5 = src[base+5*row+bx]
+                    b6 = src[base+6*row+bx]
+                    b7 = src[base+7*row+bx]
+                    if not (b0|b1|b2|b3|b4|b5|b6|b7) and mode != OLED_BLIT_COPY:
+                        continue
+                    col = bx<<3
+                    s = 7
+                    while s >= 0 and col < w:
+                        v = ((b0>>s)&1) | (((b1>>s)&1)<<1) | (((b2>>s)&1)<<2) | (((b3>>s)&1)<<3) | (((b4>>s)&1)<<4) | (((b5>>s)&1)<<5) | (((b6>>s)&1)<<6) | (((b7>>s)&1)<<7)
+                        if v or mode == OLED_BLIT_COPY:
+                            self._apply(pos+col, v, 0xFF, mode)
+                        col += 1
+                        s -= 1
+            else:
+                mask = ((0xFF >> (8-n)) << bit0) & 0xFF
+                for col in range(w):
+                    sb = base + (col>>3)
+                    m = 0x80 >> (col & 7)
+                    v = 0
+                    bit = 1 << bit0
+                    k = 0
+                    while k < n:
+                        if src[sb] & m:
+                            v |= bit
+                        sb += row
+                        bit <<= 1
+                        k += 1
+                    if v or mode == OLED_BLIT_COPY:
+                        self._apply(pos+col, v, mask, mode)
+            r += n
+        self._mark_dirty(x, x+w-1, y>>3, (y+h-1)>>3)
     
-    def init(self, screen_width=96, screen_height=40):
+    def init(self, screen_width=96, screen_height=40, auto_flush=True, async_flush=False):
         """
 
-.. method:: init(screen_width=96, screen_height=40)
+.. method:: init(screen_width=96, screen_height=40, auto_flush=True, async_flush=False)
 
         Initialize the SSD1306 setting all internal registers and the display dimensions in pixels.
 
         :param screen_width: width in pixels of the display (max 128); default 96
         :param screen_height: height in pixels of the display (max 64); default 40
-        
+        :param auto_flush(*bool*): if True every drawing function immediately sends its changes to the display, otherwise drawing only updates the internal frame buffer until :func:`show()` is called; default True
+        :param async_flush(*bool*): if True transfers are performed by a thread owned by the driver, see :func:`show()`; implies ``auto_flush=False``; default False
+
         """
 
         if screen_width > 128 or screen_height > 64:
             raise ValueError
+        self.wait_flush()
+        self._async_flush = async_flush
+        if async_flush:
+            auto_flush = False
+        self._auto_flush = auto_flush
+        self._scrolling = False
         self._screen_width = screen_width
         self._screen_height = screen_height
         self._screen_pages = screen_height//8
         self._buf_display = bytearray(self._screen_width*self._screen_pages)
-        cc = 0
-        while cc < self._screen_width*self._screen_pages:
-            self._buf_display[cc] = 0x00
-            cc +=1
+        # one page row of each color, source of the slice assignments of _fill_span
+        self._zeros = bytearray(self._screen_width)
+        self._ones = bytearray(self._screen_width)
+        for i in range(self._screen_width):
+            self._ones[i] = 0xFF
         self._column_offset = (128-screen_width)
         self._raw_offset = 0
-        self._command(SETDISPLAYCLOCKDIV)   #set display clock divide ratio 
-        self._command(0x80)                 #0x80 
-        self._command(SETMULTIPLEX)         #set mux ratio
-        self._command(self._screen_height-1)
-        self._command(SETDISPLAYOFFSET)     #set display offset
-        self._command(0x00)                 #0x00
-        self._command(SETSTARTLINE)         #Set Display Start Line
-        self._command(CHARGEPUMP)           #Charge Pump Setting
-        self._command(0x14)                 #0x14 Enable charge pump during display on
-        self._command(SEGREMAP | 0x01)      #0xA1 Set Remap
-        self._command(COMSCANDEC)           #Set COM Output Scan Direction 
-        self._command(SETCOMPINS)           #Set COM Pins Hardware Configuration
-        self._command(0x12)                 #0x12 Alternative COM pin configuration
-        self._command(SETCONTRAST)          #set contrast control
-        self._command(0xAF)                 #0xAF  
-        self._command(SETPRECHARGE)         #Set Pre-charge Period
-        self._command(0xF1)                 #0xF1
-        self._command(SETVCOMDETECT)        #Set VCOMH Deselect Level 
-        self._command(0x40)                  
-        self._command(DISPLAYALLON_RESUME)  #disable entire display on
-        self._command(NORMALDISPLAY)        #set normal display
+        # GDDRAM content is undefined after reset: the first flush sends the whole frame
+        self._clear_dirty()
+        self._mark_all_dirty()
+        self._win_cmd = bytearray([COLUMNADDR, 0, 0, PAGEADDR, 0, 0])
+        if async_flush:
+            # front buffer, read by the flush thread while drawing goes on in _buf_display
+            self._front = bytearray(len(self._buf_display))
+            if self._flush_request is None:
+                self._flush_request = threading.Event()
+                self._flush_done = threading.Event()
+                self._flush_done.set()
+                thread(self._flush_loop)
+        self._send_commands(bytearray([
+            SETDISPLAYCLOCKDIV,     #set display clock divide ratio 
+            0x80,                   #0x80 
+            SETMULTIPLEX,           #set mux ratio
+            self._screen_height-1,
+            SETDISPLAYOFFSET,       #set display offset
+            0x00,                   #0x00
+            SETSTARTLINE,           #Set Display Start Line
+            CHARGEPUMP,             #Charge Pump Setting
+            0x14,                   #0x14 Enable charge pump during display on
+            SEGREMAP | 0x01,        #0xA1 Set Remap
+            COMSCANDEC,             #Set COM Output Scan Direction 
+            SETCOMPINS,             #Set COM Pins Hardware Configuration
+            0x12,                   #0x12 Alternative COM pin configuration
+            SETCONTRAST,            #set contrast control
+            0xAF,                   #0xAF  
+            SETPRECHARGE,           #Set Pre-charge Period
+            0xF1,                   #0xF1
+            SETVCOMDETECT,          #Set VCOMH Deselect Level 
+            0x40,
+            DISPLAYALLON_RESUME,    #disable entire display on
+            NORMALDISPLAY,          #set normal display
+            MEMORYMODE,             #Set Memory Addressing Mode
+            0x00,                   #0x00 Horizontal addressing, needed by COLUMNADDR/PAGEADDR windows
+            DEACTIVATE_SCROLL       #stop any scrolling left active
+        ]))
 
     def on(self):
         """
@@ -313,7 +735,7 @@ class SSD1306(i2c.I2C):
         Turns on the display.
 
         """
-        self._command(DISPLAYON)
+        self._send_command(DISPLAYON)
         
     def off(self):
         """
@@ -323,7 +745,7 @@ class SSD1306(i2c.I2C):
         Turns off the display.
 
         """
-        self._command(DISPLAYOFF)
+        self._send_command(DISPLAYOFF)
 
     def invert(self):
         """
@@ -333,7 +755,7 @@ class SSD1306(i2c.I2C):
         Sets the display in complementary mode.
 
         """
-        self._command(INVERTDISPLAY)
+        self._send_command(INVERTDISPLAY)
         
     def normal(self):
         """
@@ -343,24 +765,149 @@ class SSD1306(i2c.I2C):
         Sets the display in normal mode.
 
         """
-        self._command(NORMALDISPLAY)
+        self._send_command(NORMALDISPLAY)
+
+    def _scroll_setup(self, start_page, end_page, speed):
+        if end_page is None:
+            end_page = self._screen_pages-1
+        if start_page < 0 or end_page >= self._screen_pages or start_page > end_page:
+            raise ValueError
+        if speed not in _SCROLL_FRAMES:
+            raise ValueError
+        return end_page, _SCROLL_FRAMES.index(speed)
+
+    def _start_scroll(self, seq):
+        # the display RAM must hold everything drawn so far before it starts scrolling:
+        # changes held back by auto_flush=False, the frame rate limit or a transfer
+        # of the flush thread still in progress are sent first
+        self.wait_flush()
+        self._send_data()
+        self._scrolling = True
+        self._send_commands(seq)
+
+    def scroll_horizontal(self, start_page=0, end_page=None, direction=OLED_SCROLL_RIGHT, speed=5):
+        """
+
+.. method:: scroll_horizontal(start_page=0, end_page=None, direction=OLED_SCROLL_RIGHT, speed=5)
+
+        Starts the continuous horizontal scrolling of a range of pages, performed by the SSD1306 itself without any transfer over the bus.
+        Changes drawn and not yet sent to the display are sent first, whatever the flush mode.
+
+        :param start_page: first page (row of 8 pixels) to be scrolled; default 0
+        :param end_page: last page to be scrolled; default None (last page of the display)
+        :param direction: ``OLED_SCROLL_RIGHT`` or ``OLED_SCROLL_LEFT``; default ``OLED_SCROLL_RIGHT``
+        :param speed: number of frames between two scroll steps, one of 2, 3, 4, 5, 25, 64, 128, 256; default 5
+
+        .. note:: While scrolling is active the display RAM must not be written: drawing functions keep updating the frame buffer,
+                  but the changes are sent to the display only after :func:`stop_scroll()`.
+
+        """
+        end_page, code = self._scroll_setup(start_page, end_page, speed)
+        if direction == OLED_SCROLL_LEFT:
+            cmd = LEFT_HORIZONTAL_SCROLL
+        else:
+            cmd = RIGHT_HORIZONTAL_SCROLL
+        self._start_scroll(bytearray([DEACTIVATE_SCROLL, cmd, 0x00, start_page, code, end_page, 0x00, 0xFF, ACTIVATE_SCROLL]))
+
+    def scroll_diagonal(self, start_page=0, end_page=None, direction=OLED_SCROLL_RIGHT, speed=5, vertical_offset=1):
+        """
+
+.. method:: scroll_diagonal(start_page=0, end_page=None, direction=OLED_SCROLL_RIGHT, speed=5, vertical_offset=1)
+
+        Starts the continuous vertical and horizontal scrolling, performed by the SSD1306 itself without any transfer over the bus.
+        The pages from ``start_page`` to ``end_page`` scroll horizontally, while the vertical scroll area (see :func:`set_vertical_scroll_area()`) moves up by ``vertical_offset`` rows at each step.
+
+        :param start_page: first page (row of 8 pixels) to be scrolled horizontally; default 0
+        :param end_page: last page to be scrolled horizontally; default None (last page of the display)
+        :param direction: ``OLED_SCROLL_RIGHT`` or ``OLED_SCROLL_LEFT``; default ``OLED_SCROLL_RIGHT``
+        :param speed: number of frames between two scroll steps, one of 2, 3, 4, 5, 25, 64, 128, 256; default 5
+        :param vertical_offset: rows scrolled vertically at each step (1 to 63, 0 for horizontal scrolling only); default 1
+
+        .. note:: As for :func:`scroll_horizontal()`, the changes drawn while scrolling are sent to the display only after :func:`stop_scroll()`.
+
+        """
+        end_page, code = self._scroll_setup(start_page, end_page, speed)
+        if vertical_offset < 0 or vertical_offset > 63:
+            raise ValueError
+        if direction == OLED_SCROLL_LEFT:
+            cmd = VERTICAL_AND_LEFT_HORIZONTAL_SCROLL
+        else:
+            cmd = VERTICAL_AND_RIGHT_HORIZONTAL_SCROLL
+        self._start_scroll(bytearray([DEACTIVATE_SCROLL, cmd, 0x00, start_page, code, end_page, vertical_offset, ACTIVATE_SCROLL]))
+
+    def set_vertical_scroll_area(self, top=0, rows=None):
+        """
+
+.. method:: set_vertical_scroll_area(top=0, rows=None)
+
+        Sets the area scrolled vertically by :func:`scroll_diagonal()`; the rows above it stay fixed.
+
+        :param top: number of fixed rows on top of the display; default 0
+        :param rows: number of rows in the scroll area; default None (all the rows below the fixed ones)
+
+        """
+        if rows is None:
+            rows = self._screen_height - top
+        if top < 0 or rows < 0 or top+rows > self._screen_height:
+            raise ValueError
+        self._send_commands(bytearray([SET_VERTICAL_SCROLL_AREA, top, rows]))
+
+    def stop_scroll(self):
+        """
+
+.. method:: stop_scroll()
+
+        Stops scrolling. Since the display RAM content is scrambled by scrolling, the whole frame buffer,
+        including the changes drawn while scrolling, is sent again to the display.
+
+        """
+        self._send_commands(bytearray([DEACTIVATE_SCROLL]))
+        self._scrolling = False
+        self._mark_all_dirty()
+        self._send_data()
 
     def _set_font(self, font=None):
+        # font can be bytes (kept in flash and indexed in place) or a list of ints
+        # with the same layout, see fonts.py
         try:
             if font != None:
                 self.font = font
                 self.first_char = font[2] | font[3] << 8
                 self.last_char = font[4] | font[5] << 8
                 self.font_height = font[6] 
+                self.font_id = _font_id(font)
         except Exception as e:
             print("font not recognized:", e)
 
+    def set_font(self, font):
+        """
+
+.. method:: set_font(font)
+
+        Sets the font used by :func:`draw_text()`.
+
+        :param font: font data as bytes (recommended: it is read in place, without copies in RAM) or as a list of integers, in the same layout of the fonts in the ``fonts`` module
+
+        Example: ::
+
+            from solomon.ssd1306 import fonts
+
+            oled.set_font(fonts.guiFont_Tahoma_7_Regular)
+
+        """
+        self._set_font(font=font)
+        self.font_init = True
+
     def _set_text_prop(self, align=OLED_TEXT_ALIGN_CENTER):
         if align not in OLED_TEXT_ALIGN:
             align = OLED_TEXT_ALIGN_CENTER
         self.align = align
 
     def _get_text_width(self, text):
+        if text in _width_cache:
+            v = _width_cache[text]
+            if v >> 16 == self.font_id:
+                return v & 0xFFFF
         t_width = 0
         for c in text:
             index = 8 + ((ord(c) - self.first_char) << 2)
@@ -369,81 +916,102 @@ class SSD1306(i2c.I2C):
             t_width += 1
         # remove last space
         t_width -= 1
+        if t_width > 0:
+            if len(_width_cache) >= TEXT_CACHE_SIZE:
+                _width_cache.clear()
+            _width_cache[text] = (self.font_id << 16) | t_width
         return t_width
 
-    def _add_text(self, text, fill):
+    def _layout(self, text, w, wrap):
+        # lines of text fitting w pixels, as [font_id, w, wrap, start, end, width, start, end, width, ...]
+        # with end excluded; spaces at the breaks are dropped. Long words are broken between characters,
+        # without wrap the exceeding characters are cut
+        if text in _layout_cache:
+            lay = _layout_cache[text]
+            if lay[0] == self.font_id and lay[1] == w and lay[2] == wrap:
+                return lay
+        lay = [self.font_id, w, wrap]
+        font = self.font
+        first = self.first_char
+        n = len(text)
+        pos = 0
+        while pos < n:
+            i = pos
+            lw = -1
+            brk = -1
+            brk_w = 0
+            while i < n and text[i] != "\n":
+                cw = font[8 + ((ord(text[i]) - first) << 2)] + 1
+                if lw + cw > w:
+                    break
+                if text[i] == " " and i > pos:
+                    brk = i
+                    brk_w = lw
+                lw += cw
+                i += 1
+            nxt = i
+            if i < n and text[i] != "\n":
+                if not wrap:
+                    # cut: go on from the next line break
+                    while nxt < n and text[nxt] != "\n":
+                        nxt += 1
+                elif brk > pos and text[i] != " ":
+                    i = brk
+                    lw = brk_w
+                    nxt = brk
+                elif i == pos:
+                    # a char wider than the box is skipped
+                    nxt = i+1
+                if wrap:
+                    while nxt < n and text[nxt] == " ":
+                        nxt += 1
+            if nxt < n and text[nxt] == "\n":
+                nxt += 1
+            # spaces before a break or at the end of the text are not part of the line
+            while i > pos and text[i-1] == " ":
+                i -= 1
+                lw -= font[8 + ((ord(" ") - first) << 2)] + 1
+            if lw < 0:
+                lw = 0
+            lay.append(pos)
+            lay.append(i)
+            lay.append(lw)
+            pos = nxt
+        if len(_layout_cache) >= TEXT_CACHE_SIZE:
+            _layout_cache.clear()
+        _layout_cache[text] = lay
+        return lay
+
+    def _add_text(self, text, x, y, w, h, fill):
+        # the box grows to fit the text, the text is centered vertically inside it
         t_width = self._get_text_width(text)
-        if self.dynamic_area["width"]<t_width or self.dynamic_area["height"]<self.font_height:
-            self.dynamic_area["width"] = t_width
-            self.dynamic_area["height"]=self.font_height
-        y = (self.dynamic_area["height"] - self.font_height) >> 1
-        if self.align == OLED_TEXT_ALIGN_LEFT:
-            x = 0
-        elif self.align == OLED_TEXT_ALIGN_RIGHT:
-            x = self.dynamic_area["width"] - t_width
+        if w<t_width or h<self.font_height:
+            w = t_width
+            h = self.font_height
+        self._check_coordinates(x, y, w, h)
+        # paint the text box background, then blit the characters one by one
+        self._fill_span(x, y, w, h, not fill, True)
+        cx = x
+        if self.align == OLED_TEXT_ALIGN_RIGHT:
+            cx += w - t_width
         elif self.align == OLED_TEXT_ALIGN_CENTER:
-            x = ((self.dynamic_area["width"] - t_width)//2)
-        elif self.align == OLED_TEXT_ALIGN_NONE:
-            x = 0
-        # write the characters into designated space, one by one
-        self._create_text_background(fill)
+            cx += (w - t_width)//2
+        cy = y + ((h - self.font_height) >> 1)
         for c in text:
-            c_width = self._write_c_to_buf(c, fill)
-            idx = ((y*self.dynamic_area["width"]) + x)
-            self._add_char_to_dynamic_area(idx, c_width)
-            x += c_width + 1
-            self.c_buf = None
-
-    def _create_text_background(self, fill=True):
-        count = 0
-        area = self.dynamic_area["width"]*self.dynamic_area["height"]
-        self.dynamic_area["buffer"] = bytearray(area)
-        while count < area:
-            if fill == False:
-                self.dynamic_area["buffer"][count] = 0xFF
-            else:
-                self.dynamic_area["buffer"][count] = 0x00
-            count +=1
-
-    def _add_char_to_dynamic_area(self, idx, c_width, c_height):
-        x_count = 0
-        for b in self.c_buf:
-            self.dynamic_area["buffer"][idx] = b
-            x_count += 1
-            if x_count == c_width:
-                x_count = 0
-                idx += (self.dynamic_area["width"]-c_width)
-            idx += 1
-
-    def _write_c_to_buf(self, c, fill=True):
+            cx += self._draw_char(c, cx, cy, fill) + 1
+
+    def _draw_char(self, c, x, y, fill=True):
         idx = 8 + ((ord(c) - self.first_char) << 2)
         c_width = self.font[idx]
-        offset = self.font[idx+1] | (self.font[idx+2] << 8) | (self.font[idx+3] << 16)
-        area = self.font_height*c_width
-        self.c_buf = bytearray(area)
-        cnt = 0
-        x_count = 0
-        while cnt < area:
-            if x_count == 0:
-                mask = 1
-                byte = self.font[offset]
-            if (byte & mask) != 0:
-                if fill == False:
-                    self.c_buf[cnt] = 0x00
-                else:
-                    self.c_buf[cnt] = 0xFF
-            else:
-                if fill == False:
-                    self.c_buf[cnt] = 0xFF
-                else:
-                    self.c_buf[cnt] = 0x00
-            mask = mask << 1
-            cnt += 1
-            x_count += 1
-            if x_count == c_width:
-                x_count = 0
-                offset += 1
+        glyph = _get_glyph(self.font, self.font_id, idx, self.font_height)
+        _blit_glyph(self._buf_display, self._screen_width, glyph, c_width, self.font_height, x, y, fill)
         return c_width
+
+    def _load_default_font(self):
+        if not self.font_init:
+            from solomon.ssd1306 import fonts
+            self._set_font(font=fonts.guiFont_Tahoma_7_Regular)
+            self.font_init = True
     
     def set_contrast(self, contrast=0x7F):
         """
@@ -457,9 +1025,234 @@ class SSD1306(i2c.I2C):
         """
         if contrast < 0 or contrast > 255:
             raise ValueError
-        self._command(SETCONTRAST)
-        self._command(contrast)
-    
+        self._send_commands(bytearray([SETCONTRAST, contrast]))
+
+    def fade(self, start, end, duration, wait=True):
+        """
+
+.. method:: fade(start, end, duration, wait=True)
+
+        Changes the contrast of the display gradually from ``start`` to ``end`` in ``duration`` milliseconds.
+
+        The ramp is run by the driver with a single two byte command per step, at most one step every 10 ms and only when the contrast level changes:
+        the levels follow the elapsed time, so a slow bus shortens the waits instead of stretching the ramp.
+        A new fade stops the one in progress.
+
+        :param start: initial contrast (from 0 to 255)
+        :param end: final contrast (from 0 to 255)
+        :param duration: duration of the ramp in milliseconds
+        :param wait: if True returns at the end of the ramp, otherwise the ramp is run by a separate thread and the function returns immediately; default True
+
+        Example: ::
+
+            # fade in and out in one second each
+            oled.fade(0, 255, 1000)
+            oled.fade(255, 0, 1000)
+
+        """
+        if start < 0 or start > 255 or end < 0 or end > 255 or duration < 0:
+            raise ValueError
+        self._fade_gen += 1
+        if wait:
+            self._fade_loop(self._fade_gen, start, end, duration)
+        else:
+            thread(self._fade_loop, self._fade_gen, start, end, duration)
+
+    def _fade_loop(self, gen, start, end, duration):
+        cmd = bytearray(2)
+        cmd[0] = SETCONTRAST
+        last = -1
+        t0 = timers.now()
+        while gen == self._fade_gen:
+            t = timers.now()-t0
+            if t >= duration:
+                level = end
+            else:
+                level = start + (end-start)*t//duration
+            if level != last:
+                cmd[1] = level
+                self._send_commands(cmd)
+                last = level
+            if t >= duration:
+                break
+            sleep(_FADE_PERIOD)
+
+    def hw_fade(self, mode=OLED_FADE_OUT, frames=8):
+        """
+
+.. method:: hw_fade(mode=OLED_FADE_OUT, frames=8)
+
+        Starts (or stops) the fade out or the blinking performed by the SSD1306 itself, without any further transfer over the bus and any work of the microcontroller.
+
+        :param mode: ``OLED_FADE_OUT`` to fade the display out down to its minimum contrast, ``OLED_FADE_BLINK`` to fade it out and in continuously,
+                     ``OLED_FADE_OFF`` to stop fading and restore the contrast; default ``OLED_FADE_OUT``
+        :param frames: number of frames between two contrast steps, a multiple of 8 from 8 to 128; default 8
+
+        .. note:: The fade out and blinking command is not available in the first revisions of the SSD1306: on those panels this function has no effect.
+
+        """
+        if mode != OLED_FADE_OFF and mode != OLED_FADE_OUT and mode != OLED_FADE_BLINK:
+            raise ValueError
+        if frames < 8 or frames > 128 or frames & 7:
+            raise ValueError
+        self._send_commands(bytearray([SET_FADE_BLINK, mode | ((frames>>3)-1)]))
+
+    def send_commands(self, cmds):
+        """
+
+.. method:: send_commands(cmds)
+
+        Sends a sequence of raw command bytes to the SSD1306 in a single bus transaction.
+
+        :param cmds: bytes or bytearray with the commands (and their arguments) to be sent
+
+        Example: ::
+
+            # set contrast and invert the display at once
+            oled.send_commands(bytearray([0x81, 0x40, 0xA7]))
+
+        """
+        self._send_commands(cmds)
+
+    def show(self):
+        """
+
+.. method:: show()
+
+        Sends to the display all the changes drawn since the last transfer.
+
+        When the display has been initialized with ``auto_flush=False`` (see :func:`init()`), drawing functions only update the internal frame buffer:
+        a whole screen can be composed with several calls and then transferred at once with this function.
+
+        When the display has been initialized with ``async_flush=True``, the frame buffer is copied into a second (front) buffer and the transfer
+        is performed by the flush thread of the driver: this function returns immediately, unless the previous transfer is still in progress,
+        and drawing can go on while the frame is being sent. Use :func:`wait_flush()` to wait for the end of the transfer.
+
+        """
+        if not self._async_flush:
+            self._send_data()
+            return
+        self.wait_flush()
+        win = self._take_dirty()
+        if win is None:
+            return
+        self._front[:] = self._buf_display
+        self._front_x0 = win[0]
+        self._front_x1 = win[1]
+        self._front_p0 = win[2]
+        self._front_p1 = win[3]
+        self._flush_done.clear()
+        self._flush_request.set()
+
+    def set_max_fps(self, fps=0):
+        """
+
+.. method:: set_max_fps(fps=0)
+
+        Limits the rate of the transfers to the display: drawing functions only mark the frame as changed and a scheduler thread of the driver
+        sends all the pending changes at once, at most ``fps`` times per second. Bursts of drawing calls, even from different threads, are merged into a single transfer,
+        capping the bus usage of the display.
+
+        :param fps: maximum number of transfers per second; 0 disables the limit and restores the behaviour set by :func:`init()`; default 0
+
+        .. note:: Changes are shown with a delay of up to one period: use :func:`flush_now()` to send them immediately.
+
+        """
+        if fps < 0:
+            raise ValueError
+        # a new generation makes any running scheduler thread exit
+        self._fps_gen += 1
+        if fps == 0:
+            self._fps_period = 0
+            self._flush()
+            return
+        self._fps_period = 1000//fps
+        if self._fps_period < 1:
+            self._fps_period = 1
+        thread(self._fps_loop, self._fps_gen)
+
+    def flush_now(self):
+        """
+
+.. method:: flush_now()
+
+        Sends all the pending changes to the display immediately and waits for the end of the transfer, regardless of the frame rate limit set by :func:`set_max_fps()`.
+
+        """
+        self.show()
+        self.wait_flush()
+
+    def enable_stats(self, enabled=True, hook=None):
+        """
+
+.. method:: enable_stats(enabled=True, hook=None)
+
+        Enables (or disables) the counters of the bus usage of the display, read with :func:`stats()`. Counters start from zero.
+        While disabled, the only overhead on the transfers is a single test per transaction.
+
+        :param enabled: True to enable the counters, False to disable them; default True
+        :param hook: function called after each flush of the frame buffer as ``hook(x0, x1, p0, p1, ms)``, with the window sent
+                     (columns ``x0`` to ``x1``, pages ``p0`` to ``p1``) and the time spent, for per-flush tracing; default None
+
+        """
+        if enabled:
+            self._stats_hook = hook
+            self._stats = [0, 0, 0, 0, 0, 0]
+        else:
+            self._stats = None
+            self._stats_hook = None
+
+    def stats(self):
+        """
+
+.. method:: stats()
+
+        Returns the bus counters since :func:`enable_stats()` or the last :func:`reset_stats()` as a dictionary, or None if they are disabled:
+
+        * ``commands``: command bytes sent, including arguments and the windows of the transfers
+        * ``data_bytes``: bytes of display data sent
+        * ``transactions``: bus writes
+        * ``flushes``: transfers of the frame buffer to the display
+        * ``bus_time``: time spent in bus transfers, in milliseconds
+        * ``skipped_bytes``: bytes of the frame buffer not sent by the flushes thanks to partial updates
+
+        """
+        st = self._stats
+        if st is None:
+            return None
+        return {
+            "commands": st[_STAT_COMMANDS],
+            "data_bytes": st[_STAT_DATA],
+            "transactions": st[_STAT_TRANSACTIONS],
+            "flushes": st[_STAT_FLUSHES],
+            "bus_time": st[_STAT_BUS_TIME],
+            "skipped_bytes": st[_STAT_SKIPPED]
+        }
+
+    def reset_stats(self):
+        """
+
+.. method:: reset_stats()
+
+        Sets all the bus counters to zero.
+
+        """
+        st = self._stats
+        if st is not None:
+            for i in range(len(st)):
+                st[i] = 0
+
+    def wait_flush(self):
+        """
+
+.. method:: wait_flush()
+
+        Waits for the end of the transfer started by :func:`show()` when the display has been initialized with ``async_flush=True``; returns immediately otherwise.
+
+        """
+        if self._flush_request is not None:
+            self._flush_done.wait()
+
     def clear(self):
         """
 
@@ -468,11 +1261,8 @@ class SSD1306(i2c.I2C):
         Clears the display.
 
         """
-        cc = 0
-        while cc < self._screen_width*self._screen_pages:
-            self._buf_display[cc] = 0x00
-            cc +=1
-        self._send_data()
+        self._fill_span(0, 0, self._screen_width, self._screen_height, False)
+        self._flush()
     
     def fill_screen(self):
         """
@@ -481,11 +1271,8 @@ class SSD1306(i2c.I2C):
         Fills the entire display (white screen in normal mode).
 
         """
-        cc = 0
-        while cc < self._screen_width*self._screen_pages:
-            self._buf_display[cc] = 0xFF
-            cc +=1
-        self._send_data()
+        self._fill_span(0, 0, self._screen_width, self._screen_height, True)
+        self._flush()
 
     def fill_rect(self, x, y, w, h, fill=True):
         """
@@ -503,12 +1290,293 @@ class SSD1306(i2c.I2C):
 
         """
         self._check_coordinates(x,y,w,h)    
-        self._prepare(x,y,w,h,fill)
-        self._send_data()
+        self._fill_span(x,y,w,h,fill)
+        self._flush()
+
+    # Primitives: shapes are drawn into the frame buffer by the helpers below, which don't
+    # mark anything dirty; each public function marks its bounding box and flushes once
+
+    def _check_point(self, x, y):
+        if x < 0 or y < 0 or x >= self._screen_width or y >= self._screen_height:
+            raise ValueError
+
+    def _plot(self, x, y, fill):
+        pos = (y>>3)*self._screen_width + x
+        if fill:
+            self._buf_display[pos] |= 1 << (y & 7)
+        else:
+            self._buf_display[pos] &= ~(1 << (y & 7)) & 0xFF
+
+    def _hspan(self, x, y, w, fill):
+        # one byte per column, all with the same bit
+        pos = (y>>3)*self._screen_width + x
+        bit = 1 << (y & 7)
+        if fill:
+            for i in range(pos, pos+w):
+                self._buf_display[i] |= bit
+        else:
+            bit = ~bit & 0xFF
+            for i in range(pos, pos+w):
+                self._buf_display[i] &= bit
+
+    def _vspan(self, x, y0, y1, fill):
+        # one masked write per page, rows y0..y1 inclusive
+        width = self._screen_width
+        p0 = y0>>3
+        p1 = y1>>3
+        pos = p0*width + x
+        for page in range(p0, p1+1):
+            bb = 0xFF
+            if page == p0:
+                bb = _MASK_FROM[y0 & 7]
+            if page == p1:
+                bb &= _MASK_TO[y1 & 7]
+            if fill:
+                self._buf_display[pos] |= bb
+            else:
+                self._buf_display[pos] &= ~bb & 0xFF
+            pos += width
+
+    def _circle(self, cx, cy, r, corners, fill, solid):
+        # midpoint circle; corners selects the quadrants (1 top left, 2 top right,
+        # 4 bottom right, 8 bottom left). Solid circles are filled with vertical spans
+        # between symmetric points, that cost one masked write per page
+        x = 0
+        y = r
+        d = 1 - r
+        while x <= y:
+            if solid:
+                if corners & 9:
+                    self._vspan(cx-x, cy-y, cy+y, fill)
+                    self._vspan(cx-y, cy-x, cy+x, fill)
+                if corners & 6:
+                    self._vspan(cx+x, cy-y, cy+y, fill)
+                    self._vspan(cx+y, cy-x, cy+x, fill)
+            else:
+                if corners & 1:
+                    self._plot(cx-x, cy-y, fill)
+                    self._plot(cx-y, cy-x, fill)
+                if corners & 2:
+                    self._plot(cx+x, cy-y, fill)
+                    self._plot(cx+y, cy-x, fill)
+                if corners & 4:
+                    self._plot(cx+x, cy+y, fill)
+                    self._plot(cx+y, cy+x, fill)
+                if corners & 8:
+                    self._plot(cx-x, cy+y, fill)
+                    self._plot(cx-y, cy+x, fill)
+            x += 1
+            if d < 0:
+                d += 2*x + 1
+            else:
+                y -= 1
+                d += 2*(x-y) + 1
+
+    def draw_hline(self, x, y, w, fill=True):
+        """
+
+.. method:: draw_hline(x, y, w, fill=True)
+
+        Draws a horizontal line in the screen.
+
+        :param x: x-coordinate of the left end of the line
+        :param y: y-coordinate of the line
+        :param w: length of the line
+        :param fill(*bool*): if True draws a white line, otherwise a black line (in normal mode); default True
+
+        """
+        self._check_coordinates(x,y,w,1)
+        self._hspan(x, y, w, fill)
+        self._mark_dirty(x, x+w-1, y>>3, y>>3)
+        self._flush()
+
+    def draw_vline(self, x, y, h, fill=True):
+        """
+
+.. method:: draw_vline(x, y, h, fill=True)
+
+        Draws a vertical line in the screen.
+
+        :param x: x-coordinate of the line
+        :param y: y-coordinate of the top end of the line
+        :param h: length of the line
+        :param fill(*bool*): if True draws a white line, otherwise a black line (in normal mode); default True
+
+        """
+        self._check_coordinates(x,y,1,h)
+        self._vspan(x, y, y+h-1, fill)
+        self._mark_dirty(x, x, y>>3, (y+h-1)>>3)
+        self._flush()
+
+    def draw_line(self, x0, y0, x1, y1, fill=True):
+        """
+
+.. method:: draw_line(x0, y0, x1, y1, fill=True)
+
+        Draws a line between two points of the screen, both included. Horizontal and vertical lines are drawn as with :func:`draw_hline()` and :func:`draw_vline()`,
+        sloped lines with the Bresenham algorithm.
+
+        :param x0: x-coordinate of the first point
+        :param y0: y-coordinate of the first point
+        :param x1: x-coordinate of the second point
+        :param y1: y-coordinate of the second point
+        :param fill(*bool*): if True draws a white line, otherwise a black line (in normal mode); default True
+
+        """
+        self._check_point(x0, y0)
+        self._check_point(x1, y1)
+        if y0 == y1:
+            if x0 > x1:
+                x0, x1 = x1, x0
+            self.draw_hline(x0, y0, x1-x0+1, fill)
+            return
+        if x0 == x1:
+            if y0 > y1:
+                y0, y1 = y1, y0
+            self.draw_vline(x0, y0, y1-y0+1, fill)
+            return
+        if x0 < x1:
+            if y0 < y1:
+                self._mark_dirty(x0, x1, y0>>3, y1>>3)
+            else:
+                self._mark_dirty(x0, x1, y1>>3, y0>>3)
+        elif y0 < y1:
+            self._mark_dirty(x1, x0, y0>>3, y1>>3)
+        else:
+            self._mark_dirty(x1, x0, y1>>3, y0>>3)
+        buf = self._buf_display
+        width = self._screen_width
+        dx = x1-x0
+        sx = 1
+        if dx < 0:
+            dx = -dx
+            sx = -1
+        dy = y0-y1
+        sy = 1
+        if dy > 0:
+            dy = -dy
+            sy = -1
+        err = dx+dy
+        while True:
+            pos = (y0>>3)*width + x0
+            if fill:
+                buf[pos] |= 1 << (y0 & 7)
+            else:
+                buf[pos] &= ~(1 << (y0 & 7)) & 0xFF
+            if x0 == x1 and y0 == y1:
+                break
+            e2 = 2*err
+            if e2 >= dy:
+                err += dy
+                x0 += sx
+            if e2 <= dx:
+                err += dx
+                y0 += sy
+        self._flush()
+
+    def draw_rect(self, x, y, w, h, fill=True):
+        """
+
+.. method:: draw_rect(x, y, w, h, fill=True)
+
+        Draws the outline of a rectangle in the screen.
+
+        :param x: x-coordinate for left high corner of the rectangle
+        :param y: y-coordinate for left high corner of the rectangle
+        :param w: width of the rectangle
+        :param h: height of the rectangle
+        :param fill(*bool*): if True draws a white outline, otherwise a black outline (in normal mode); default True
+
+        """
+        self._check_coordinates(x,y,w,h)
+        self._hspan(x, y, w, fill)
+        self._hspan(x, y+h-1, w, fill)
+        self._vspan(x, y, y+h-1, fill)
+        self._vspan(x+w-1, y, y+h-1, fill)
+        self._mark_dirty(x, x+w-1, y>>3, (y+h-1)>>3)
+        self._flush()
+
+    def draw_round_rect(self, x, y, w, h, r, fill=True):
+        """
+
+.. method:: draw_round_rect(x, y, w, h, r, fill=True)
+
+        Draws the outline of a rectangle with rounded corners in the screen.
+
+        :param x: x-coordinate for left high corner of the rectangle
+        :param y: y-coordinate for left high corner of the rectangle
+        :param w: width of the rectangle
+        :param h: height of the rectangle
+        :param r: radius of the corners, reduced to fit the rectangle if needed
+        :param fill(*bool*): if True draws a white outline, otherwise a black outline (in normal mode); default True
+
+        """
+        self._check_coordinates(x,y,w,h)
+        if r > (w-1)>>1:
+            r = (w-1)>>1
+        if r > (h-1)>>1:
+            r = (h-1)>>1
+        if r < 0:
+            r = 0
+        if w-2*r > 0:
+            self._hspan(x+r, y, w-2*r, fill)
+            self._hspan(x+r, y+h-1, w-2*r, fill)
+        if h-2*r > 0:
+            self._vspan(x, y+r, y+h-1-r, fill)
+            self._vspan(x+w-1, y+r, y+h-1-r, fill)
+        if r > 0:
+            self._circle(x+r, y+r, r, 1, fill, False)
+            self._circle(x+w-1-r, y+r, r, 2, fill, False)
+            self._circle(x+w-1-r, y+h-1-r, r, 4, fill, False)
+            self._circle(x+r, y+h-1-r, r, 8, fill, False)
+        self._mark_dirty(x, x+w-1, y>>3, (y+h-1)>>3)
+        self._flush()
+
+    def draw_circle(self, x, y, r, fill=True):
+        """
+
+.. method:: draw_circle(x, y, r, fill=True)
+
+        Draws the outline of a circle in the screen. The circle must lie entirely in the screen.
+
+        :param x: x-coordinate of the center
+        :param y: y-coordinate of the center
+        :param r: radius; ``ValueError`` is raised if negative
+        :param fill(*bool*): if True draws a white outline, otherwise a black outline (in normal mode); default True
+
+        """
+        if r < 0:
+            raise ValueError
+        self._check_point(x-r, y-r)
+        self._check_point(x+r, y+r)
+        self._circle(x, y, r, 15, fill, False)
+        self._mark_dirty(x-r, x+r, (y-r)>>3, (y+r)>>3)
+        self._flush()
+
+    def fill_circle(self, x, y, r, fill=True):
+        """
+
+.. method:: fill_circle(x, y, r, fill=True)
+
+        Draws a filled circle in the screen. The circle must lie entirely in the screen.
+
+        :param x: x-coordinate of the center
+        :param y: y-coordinate of the center
+        :param r: radius; ``ValueError`` is raised if negative
+        :param fill(*bool*): if True draws a white circle, otherwise a black circle (in normal mode); default True
+
+        """
+        if r < 0:
+            raise ValueError
+        self._check_point(x-r, y-r)
+        self._check_point(x+r, y+r)
+        self._circle(x, y, r, 15, fill, True)
+        self._mark_dirty(x-r, x+r, (y-r)>>3, (y+r)>>3)
+        self._flush()
         
-    def draw_img(self, bytes, x, y, w, h, fill=True):
+    def draw_img(self, bytes, x, y, w, h, fill=True, mode=None):
         """
-.. method:: draw_img(image, x, y, w, h, fill=True)
+.. method:: draw_img(image, x, y, w, h, fill=True, mode=None)
 
         Draws the image passed in bytearray format as argument.
 
@@ -518,10 +1586,21 @@ class SSD1306(i2c.I2C):
         :param w: width of the image
         :param h: height of the image
         :param fill(*bool*): flag for filling the image. If True draws image in standard color, otherwise draws the image in inverted color (display in normal mode); default True.
+        :param mode: how the image is merged with the screen content, overrides fill when given; default None
+
+            * ``OLED_BLIT_OR``: set pixels of the image are turned on (same as fill=True)
+            * ``OLED_BLIT_AND_NOT``: set pixels of the image are turned off (same as fill=False)
+            * ``OLED_BLIT_XOR``: set pixels of the image toggle the screen pixels
+            * ``OLED_BLIT_COPY``: the image replaces the screen content in its area, erasing what it covers
 
         .. note:: If the display is set in complementary mode (see :func:`invert()` function), fill flag set to True will draw the image in inverted color and set to False will draw the image in normal color.
 
-        .. note :: To obtain a converted image in hex array format, you can go and use this `online tool <http://www.digole.com/tools/PicturetoC_Hex_converter.php>`_.
+        .. note :: The ``tools/ssd1306img.py`` script shipped with this library converts PNG, PBM and XBM images into ready to use Python modules, choosing the smallest
+                   among the row-major format of this function, the page format of :func:`draw_img_native()` and a run-length encoded page format: ::
+
+                       python3 tools/ssd1306img.py logo.png -o logo.py
+
+                   To obtain a converted image in hex array format, you can also go and use this `online tool <http://www.digole.com/tools/PicturetoC_Hex_converter.php>`_.
                    
                    After uploading your image, you can resize it setting the width and height fields; you can also choose the code format (HEX:0x recommended) and the color format
                    ("Black/White for all draw image function" recommended).
@@ -530,14 +1609,138 @@ class SSD1306(i2c.I2C):
 
         """
         self._check_coordinates(x,y,w,h)
-        row = w//8
-        if w%8 != 0:
-            row += 1
-        for ypix in range(0,h):
-            for xpix in range(0,w):
-                if bytes[ypix*row + (xpix//8)] & (1<<(7-(xpix%8))):
-                    self._prepare(x+xpix,y+ypix,1,1,fill)
-        self._send_data()
+        if mode is None:
+            if fill:
+                mode = OLED_BLIT_OR
+            else:
+                mode = OLED_BLIT_AND_NOT
+        self._blit_rows(bytes, x, y, w, h, mode)
+        self._flush()
+
+    def draw_img_native(self, buf, x, page, w, pages, mode=OLED_BLIT_COPY):
+        """
+.. method:: draw_img_native(buf, x, page, w, pages, mode=OLED_BLIT_COPY)
+
+        Draws an image already stored in the native page format of the SSD1306: for each page (8 pixel rows) of the image, from top to bottom,
+        ``w`` bytes, one per column, with the least significant bit on top.
+
+        Since no conversion is needed, in copy mode the image is copied straight into the frame buffer: this is the fastest way to draw splash screens and icons.
+
+        :param buf: bytes or bytearray of ``w*pages`` bytes in page format; ``ValueError`` is raised if shorter
+        :param x: x-coordinate for left high corner of the image
+        :param page: page (row of 8 pixels) of the left high corner of the image
+        :param w: width of the image
+        :param pages: height of the image in pages
+        :param mode: how the image is merged with the screen content (see :func:`draw_img()`); default ``OLED_BLIT_COPY``
+
+        """
+        self._check_coordinates(x,page*8,w,pages*8)
+        # slice assignments resize the frame buffer if the source is short or long
+        if len(buf) < w*pages:
+            raise ValueError
+        width = self._screen_width
+        if mode == OLED_BLIT_COPY:
+            if x == 0 and w == width:
+                # only a longer buffer needs a slice: a full splash is copied once
+                if len(buf) == w*pages:
+                    self._buf_display[page*width:(page+pages)*width] = buf
+                else:
+                    self._buf_display[page*width:(page+pages)*width] = buf[0:w*pages]
+            else:
+                for p in range(pages):
+                    pos = (page+p)*width + x
+                    self._buf_display[pos:pos+w] = buf[p*w:(p+1)*w]
+        else:
+            for p in range(pages):
+                pos = (page+p)*width + x
+                src = p*w
+                for col in range(w):
+                    v = buf[src+col]
+                    if v:
+                        self._apply(pos+col, v, 0xFF, mode)
+        self._mark_dirty(x, x+w-1, page, page+pages-1)
+        self._flush()
+
+    def draw_img_rle(self, data, x, page, w, pages, mode=OLED_BLIT_COPY):
+        """
+.. method:: draw_img_rle(data, x, page, w, pages, mode=OLED_BLIT_COPY)
+
+        Draws a run-length encoded image in page format (see :func:`draw_img_native()`), as produced by ``tools/ssd1306img.py``.
+
+        The image is decoded while it is written into the frame buffer, without allocating the decompressed image:
+        memory used while drawing does not depend on the size of the image.
+
+        :param data: bytes or bytearray with the encoded image
+        :param x: x-coordinate for left high corner of the image
+        :param page: page (row of 8 pixels) of the left high corner of the image
+        :param w: width of the image
+        :param pages: height of the image in pages
+        :param mode: how the image is merged with the screen content (see :func:`draw_img()`); default ``OLED_BLIT_COPY``
+
+        The encoded stream is a sequence of control bytes, each followed by its data: a control byte ``c`` lower than 0x80 is followed by ``c+1`` bytes to be copied,
+        otherwise it is followed by a single byte to be repeated ``c-0x80+3`` times.
+        A stream that is truncated or doesn't decode to exactly ``w*pages`` bytes raises ``ValueError``, and nothing is drawn.
+
+        """
+        self._check_coordinates(x,page*8,w,pages*8)
+        n = len(data)
+        # malformed streams are rejected before anything is written: a short literal
+        # would resize the frame buffer through the slice assignment, and a stream of
+        # the wrong size would leave the image half drawn
+        i = 0
+        size = 0
+        while i < n:
+            c = data[i]
+            if c < 0x80:
+                i += c+2
+                size += c+1
+            else:
+                i += 2
+                size += c-0x80+3
+        if i != n or size != w*pages:
+            raise ValueError
+        width = self._screen_width
+        pos = page*width + x
+        col = 0
+        i = 0
+        while i < n:
+            c = data[i]
+            if c < 0x80:
+                count = c+1
+                lit = i+1
+                i += c+2
+            else:
+                count = c-0x80+3
+                lit = -1
+                v = data[i+1]
+                i += 2
+            while count > 0:
+                # split runs at the right edge of the image
+                k = w-col
+                if k > count:
+                    k = count
+                if lit >= 0:
+                    if mode == OLED_BLIT_COPY:
+                        self._buf_display[pos:pos+k] = data[lit:lit+k]
+                    else:
+                        for j in range(k):
+                            if data[lit+j]:
+                                self._apply(pos+j, data[lit+j], 0xFF, mode)
+                    lit += k
+                elif mode == OLED_BLIT_COPY:
+                    for j in range(pos, pos+k):
+                        self._buf_display[j] = v
+                elif v:
+                    for j in range(pos, pos+k):
+                        self._apply(j, v, 0xFF, mode)
+                pos += k
+                col += k
+                count -= k
+                if col == w:
+                    col = 0
+                    pos += width-w
+        self._mark_dirty(x, x+w-1, page, page+pages-1)
+        self._flush()
         
 
     def draw_pixel(self, x, y, fill=True):
@@ -554,8 +1757,8 @@ class SSD1306(i2c.I2C):
         
         """
         self._check_coordinates(x,y,1,1)
-        self._prepare(x,y,1,1,fill)
-        self._send_data()
+        self._fill_span(x,y,1,1,fill)
+        self._flush()
 
     def draw_text(self, text, x=None, y=None, w=None, h=None, align=None, fill=True):
         """
@@ -583,10 +1786,7 @@ class SSD1306(i2c.I2C):
                     * fill = True
 
         """
-        if not self.font_init:
-            from solomon.ssd1306 import fonts
-            self._set_font(font=fonts.guiFont_Tahoma_7_Regular)
-            self.font_init = True
+        self._load_default_font()
         if align != None:
             self._set_text_prop(align=align)
         else:
@@ -599,22 +1799,674 @@ class SSD1306(i2c.I2C):
             w = self._get_text_width(text)
         if h is None:
             h = self.font_height
-        self.dynamic_area["x"] = x
-        self.dynamic_area["y"] = y
-        self.dynamic_area["width"] = w
-        self.dynamic_area["height"] = h
-        self._add_text(text, fill)
-        count = 0
-        for ypix in range(0,self.dynamic_area["height"]):
-            for xpix in range(0,self.dynamic_area["width"]):
-                bb = 0xFF << ((y+ypix)%8) & 0xFF
-                if (y+ypix+1)%8 != 0:
-                    bb &= 0xFF >> (8-((y+ypix+1)%8)) & 0xFF
-                if self.dynamic_area["buffer"][count]:
-                    self._buf_display[(((y+ypix)//8)*self._screen_width)+x+xpix] |= bb
-                else:
-                    bb = ~bb&0xFF
-                    self._buf_display[(((y+ypix)//8)*self._screen_width)+x+xpix] &= bb
-                count += 1
-        self._send_data()
-        self.dynamic_area["buffer"] = None
+        self._add_text(text, x, y, w, h, fill)
+        self._flush()
+
+    def draw_textbox(self, text, x, y, w, h, align=OLED_TEXT_ALIGN_LEFT, valign=OLED_TEXT_VALIGN_TOP, wrap=True, fill=True):
+        """
+
+.. method:: draw_textbox(text, x, y, w, h, align=OLED_TEXT_ALIGN_LEFT, valign=OLED_TEXT_VALIGN_TOP, wrap=True, fill=True)
+
+        Prints a text of one or more lines inside a text box in the screen. Newline characters start new lines and, if ``wrap`` is True,
+        lines longer than the box width are broken between words (between characters for words longer than the box).
+
+        The text is cut at the box: characters exceeding the width (without ``wrap``) and lines exceeding the height are not drawn.
+        The whole box is drawn in a single pass and sent to the display with a single transfer.
+
+        :param text: string to be written in the display
+        :param x: x-coordinate for left high corner of the text box
+        :param y: y-coordinate for left high corner of the text box
+        :param w: width of the text box
+        :param h: height of the text box
+        :param align: horizontal alignment of each line: ``OLED_TEXT_ALIGN_LEFT``, ``OLED_TEXT_ALIGN_RIGHT`` or ``OLED_TEXT_ALIGN_CENTER``; default ``OLED_TEXT_ALIGN_LEFT``
+        :param valign: vertical alignment of the lines: ``OLED_TEXT_VALIGN_TOP``, ``OLED_TEXT_VALIGN_BOTTOM`` or ``OLED_TEXT_VALIGN_CENTER``; default ``OLED_TEXT_VALIGN_TOP``
+        :param wrap(*bool*): if True long lines are wrapped, otherwise they are cut; default True
+        :param fill(*bool*): flag for filling the text. If True draws white text in black background, otherwise black text in white background (in normal mode); default True
+
+        Line layouts are cached by text, so drawing again the same text (e.g. a status message) doesn't measure it again.
+
+        Example: ::
+
+            oled.draw_textbox("Battery low: connect the charger", 0, 0, 96, 40, align=ssd1306.OLED_TEXT_ALIGN_CENTER, valign=ssd1306.OLED_TEXT_VALIGN_CENTER)
+
+        """
+        self._load_default_font()
+        self._check_coordinates(x, y, w, h)
+        if x < 0 or y < 0:
+            raise ValueError
+        self._fill_span(x, y, w, h, not fill, True)
+        lay = self._layout(text, w, wrap)
+        fh = self.font_height
+        # lines are spaced by 1 pixel, as characters
+        lines = (len(lay)-3)//3
+        if lines > (h+1)//(fh+1):
+            lines = (h+1)//(fh+1)
+        cy = y
+        if lines > 0:
+            block = lines*(fh+1) - 1
+            if valign == OLED_TEXT_VALIGN_BOTTOM:
+                cy += h - block
+            elif valign == OLED_TEXT_VALIGN_CENTER:
+                cy += (h - block)>>1
+        k = 3
+        for line in range(lines):
+            cx = x
+            if align == OLED_TEXT_ALIGN_RIGHT:
+                cx += w - lay[k+2]
+            elif align == OLED_TEXT_ALIGN_CENTER:
+                cx += (w - lay[k+2])>>1
+            for i in range(lay[k], lay[k+1]):
+                cx += self._draw_char(text[i], cx, cy, fill) + 1
+            cy += fh + 1
+            k += 3
+        self._flush()
+
+
+class Console():
+    """
+.. class:: Console(display, fill=True)
+
+    Creates a scrolling text console (e.g. for an event log) on an initialized :class:`SSD1306` display.
+
+    The whole display RAM (64 rows, regardless of the display height) is used as a ring of text lines:
+    a new line is rendered only into its own pages and the view is scrolled by changing the display start line,
+    so that appending a line costs a single data write and one command instead of a full screen repaint.
+
+    :param display: the :class:`SSD1306` instance
+    :param fill(*bool*): if True draws white text in black background, otherwise black text in white background (in normal mode); default True
+
+    Each line is as tall as the font rounded up to a whole number of pages (16 rows for the default font); text exceeding the display width is cut.
+
+    .. note:: The console writes the display RAM directly, bypassing the frame buffer: do not use the drawing functions of the display while the console is in use,
+              and call :func:`close()` before going back to them.
+
+    Example: ::
+
+        con = ssd1306.Console(oled)
+        con.write("boot ok")
+        con.write("wifi connected")
+
+    """
+    def __init__(self, display, fill=True):
+        display._load_default_font()
+        self.display = display
+        self.fill = fill
+        self.line_pages = (display.font_height+7)>>3
+        if self.line_pages*8 > display._screen_height:
+            raise ValueError
+        self.slots = 8//self.line_pages
+        self._line = bytearray(display._screen_width*self.line_pages)
+        self._blank = bytearray(len(self._line))
+        if not fill:
+            for i in range(len(self._blank)):
+                self._blank[i] = 0xFF
+        self._cmd = bytearray(1)
+        self.clear()
+
+    def clear(self):
+        """
+.. method:: clear()
+
+        Removes all the lines from the console.
+
+        """
+        d = self.display
+        for slot in range(self.slots):
+            d._send_page_data(self._blank, 0, d._screen_width-1, slot*self.line_pages, (slot+1)*self.line_pages-1)
+        self.slot = self.slots-1
+        self._set_start(0)
+
+    def _set_start(self, row):
+        self._cmd[0] = SETSTARTLINE | (row & 63)
+        self.display._send_commands(self._cmd)
+
+    def write(self, text):
+        """
+.. method:: write(text)
+
+        Appends a line of text at the bottom of the console, scrolling the older lines up. Newline characters in ``text`` start new lines.
+
+        :param text: string to be written
+
+        """
+        d = self.display
+        width = d._screen_width
+        start = 0
+        while True:
+            end = text.find("\n", start)
+            if end < 0:
+                end = len(text)
+            self.slot += 1
+            if self.slot == self.slots:
+                self.slot = 0
+            self._line[:] = self._blank
+            x = 0
+            y = (self.line_pages*8 - d.font_height) >> 1
+            for i in range(start, end):
+                idx = 8 + ((ord(text[i]) - d.first_char) << 2)
+                c_width = d.font[idx]
+                if x + c_width > width:
+                    break
+                glyph = _get_glyph(d.font, d.font_id, idx, d.font_height)
+                _blit_glyph(self._line, width, glyph, c_width, d.font_height, x, y, self.fill)
+                x += c_width + 1
+            page = self.slot*self.line_pages
+            d._send_page_data(self._line, 0, width-1, page, page+self.line_pages-1)
+            # show the rows ending with the bottom of the new line
+            self._set_start((page+self.line_pages)*8 - d._screen_height)
+            if end >= len(text):
+                break
+            start = end+1
+
+    def close(self):
+        """
+.. method:: close()
+
+        Restores the display start line and sends the frame buffer of the display again, so that drawing functions can be used.
+
+        """
+        self._set_start(0)
+        self.display._mark_all_dirty()
+        self.display._send_data()
+
+
+class DisplayGroup():
+    """
+.. class:: DisplayGroup(displays=None)
+
+    Creates a group of :class:`SSD1306` displays sharing the same bus, e.g. two I2C displays with different ``sa0`` address bits.
+
+    The displays of a group:
+
+    * share a single bus lock, so that their transfers never interleave on the bus
+    * share the font and the glyph cache, and the read-only and transfer buffers when they have the same size,
+      so that a second display only adds its own frame buffer to the RAM usage
+    * are flushed together by :func:`show_all()`, in turns: the display served first rotates at each call,
+      so that no display is always delayed by the others
+    * can be refreshed by a single scheduler thread with :func:`set_max_fps()`
+
+    :param displays: list of initialized :class:`SSD1306` instances; more can be added with :func:`add()`; default None
+
+    Example: ::
+
+        left = ssd1306.SSD1306(I2C0, sa0=0)
+        right = ssd1306.SSD1306(I2C0, sa0=1)
+        left.init(128, 64, auto_flush=False)
+        right.init(128, 64, auto_flush=False)
+        group = ssd1306.DisplayGroup([left, right])
+        left.draw_text("left", 0, 0, 0, 0)
+        right.draw_text("right", 0, 0, 0, 0)
+        group.show_all()
+
+    """
+    def __init__(self, displays=None):
+        self.displays = []
+        self._bus_lock = threading.Lock()
+        self.font = None
+        self._next = 0
+        self._fps_period = 0
+        self._fps_gen = 0
+        if displays is not None:
+            for d in displays:
+                self.add(d)
+
+    def add(self, display):
+        """
+.. method:: add(display)
+
+        Adds an initialized display to the group. Displays must be added before drawing on them and added again after a new :func:`init()`.
+
+        :param display: the :class:`SSD1306` instance
+
+        """
+        display._bus_lock = self._bus_lock
+        if self.font is None:
+            display._load_default_font()
+            self.font = display.font
+        else:
+            display.set_font(self.font)
+        for d in self.displays:
+            if d is not display:
+                display._share_buffers(d)
+                break
+        if display not in self.displays:
+            self.displays.append(display)
+        if self._fps_period:
+            display._fps_gen += 1
+            display._fps_period = self._fps_period
+
+    def set_font(self, font):
+        """
+.. method:: set_font(font)
+
+        Sets the font of all the displays of the group, see :func:`SSD1306.set_font()`.
+
+        :param font: font data
+
+        """
+        for d in self.displays:
+            d.set_font(font)
+        self.font = font
+
+    def show_all(self):
+        """
+.. method:: show_all()
+
+        Sends to each display of the group the changes drawn since its last transfer, one display after the other.
+        Only the changed window of each display is sent; displays initialized with ``async_flush=True`` are sent by their flush threads.
+
+        """
+        n = len(self.displays)
+        if n == 0:
+            return
+        first = self._next % n
+        self._next = first+1
+        for i in range(n):
+            self.displays[(first+i) % n].show()
+
+    def wait_all(self):
+        """
+.. method:: wait_all()
+
+        Waits for the end of the transfers of all the displays of the group, see :func:`SSD1306.wait_flush()`.
+
+        """
+        for d in self.displays:
+            d.wait_flush()
+
+    def set_max_fps(self, fps=0):
+        """
+.. method:: set_max_fps(fps=0)
+
+        Limits the transfers of all the displays of the group to at most ``fps`` rounds of :func:`show_all()` per second,
+        performed by a single scheduler thread, see :func:`SSD1306.set_max_fps()`.
+
+        :param fps: maximum number of rounds per second; 0 disables the limit; default 0
+
+        """
+        if fps < 0:
+            raise ValueError
+        self._fps_gen += 1
+        if fps == 0:
+            self._fps_period = 0
+        else:
+            self._fps_period = 1000//fps
+            if self._fps_period < 1:
+                self._fps_period = 1
+        for d in self.displays:
+            # stop the scheduler of each display: the group one takes over
+            d._fps_gen += 1
+            d._fps_period = self._fps_period
+        if fps == 0:
+            for d in self.displays:
+                d._flush()
+            return
+        thread(self._fps_loop, self._fps_gen)
+
+    def _fps_loop(self, gen):
+        # same pacing of SSD1306._fps_loop, one round of flushes per period
+        next_flush = timers.now()
+        while gen == self._fps_gen:
+            next_flush += self._fps_period
+            delay = next_flush - timers.now()
+            if delay > 0:
+                sleep(delay)
+            else:
+                next_flush = timers.now()
+            if gen == self._fps_gen:
+                self.show_all()
+
+
+class Sprite():
+    """
+.. class:: Sprite(display, data, w, h, mask=None, mode=OLED_BLIT_OR)
+
+    Creates a sprite: a small image moved around an initialized :class:`SSD1306` display, e.g. for animated indicators.
+
+    The image is given in the native page format (see :func:`SSD1306.draw_img_native()`) and is shifted in advance for all the 8 vertical bit offsets,
+    so that drawing it at any position is a plain byte merge without bit shifts. Moving a sprite restores the screen content under its old position,
+    then draws it at the new one: only the bytes covered by the sprite are written, and only its old and new footprints are sent to the display.
+    The sprite may lie partially (or entirely) outside the screen: it is clipped at the screen edges.
+
+    :param display: the :class:`SSD1306` instance
+    :param data: bytes or bytearray of ``w*((h+7)//8)`` bytes in page format
+    :param w: width of the sprite
+    :param h: height of the sprite
+    :param mask: optional transparency mask in the same format of ``data``: only the pixels with the mask bit set are drawn, lit or unlit; default None
+    :param mode: without a mask, ``OLED_BLIT_OR`` draws only the lit pixels, ``OLED_BLIT_COPY`` the whole rectangle,
+                 ``OLED_BLIT_XOR`` toggles the screen pixels under the lit pixels; default ``OLED_BLIT_OR``
+
+    In XOR mode the sprite is erased by drawing it again, so no background is saved; in the other modes the bytes under the sprite are saved when it is drawn.
+
+    .. note:: The saved background is restored as it was when the sprite was drawn: hide the sprite before drawing on the screen area it covers.
+
+    Example: ::
+
+        ball = ssd1306.Sprite(oled, ball_data, 8, 8, mask=ball_mask)
+        for x in range(120):
+            ball.move(x, 20)
+
+    """
+    def __init__(self, display, data, w, h, mask=None, mode=OLED_BLIT_OR):
+        self.display = display
+        self.w = w
+        self.h = h
+        self.x = 0
+        self.y = 0
+        self.visible = False
+        self._xor = mode == OLED_BLIT_XOR and mask is None
+        pages = (h+7)>>3
+        # every shifted copy spans one more page than the image
+        self._plane = w*(pages+1)
+        if mask is None and mode == OLED_BLIT_COPY:
+            # opaque rectangle: the mask covers the h rows
+            mask = bytearray(w*pages)
+            for p in range(pages):
+                bb = 0xFF
+                if p == pages-1:
+                    bb = _MASK_TO[(h-1) & 7]
+                for col in range(w):
+                    mask[p*w+col] = bb
+        self._data = self._shift(data, w, h)
+        self._mask = None
+        if mask is not None:
+            self._mask = self._shift(mask, w, h)
+        self._bg = None
+        if not self._xor:
+            self._bg = bytearray(self._plane)
+
+    def _shift(self, src, w, h):
+        # the padding rows below h in the last page are cleared, so they are never drawn
+        plane = self._plane
+        pages = (h+7)>>3
+        last = _MASK_TO[(h-1) & 7]
+        out = bytearray(8*plane)
+        for s in range(8):
+            base = s*plane
+            for p in range(pages):
+                bb = 0xFF
+                if p == pages-1:
+                    bb = last
+                for col in range(w):
+                    v = (src[p*w+col] & bb) << s
+                    out[base+p*w+col] |= v & 0xFF
+                    out[base+(p+1)*w+col] |= v >> 8
+        return out
+
+    def _footprint(self, x, y):
+        # visible part of the sprite at x, y: first and last screen column, first and last
+        # screen page and first page of the shifted image; None when entirely off screen
+        d = self.display
+        x0 = x
+        if x0 < 0:
+            x0 = 0
+        x1 = x+self.w-1
+        if x1 >= d._screen_width:
+            x1 = d._screen_width-1
+        p0 = y>>3
+        p1 = (y+self.h-1)>>3
+        k0 = 0
+        if p0 < 0:
+            k0 = -p0
+            p0 = 0
+        if p1 >= d._screen_pages:
+            p1 = d._screen_pages-1
+        if x0 > x1 or p0 > p1:
+            return None
+        return (x0, x1, p0, p1, k0)
+
+    def _blit(self, x, y, erase):
+        fp = self._footprint(x, y)
+        if fp is None:
+            return None
+        x0 = fp[0]
+        x1 = fp[1]
+        buf = self.display._buf_display
+        width = self.display._screen_width
+        w = self.w
+        base = (y & 7)*self._plane
+        data = self._data
+        mask = self._mask
+        bg = self._bg
+        k = fp[4]
+        for page in range(fp[2], fp[3]+1):
+            pos = page*width
+            src = k*w - x
+            if self._xor:
+                for col in range(x0, x1+1):
+                    buf[pos+col] ^= data[base+src+col]
+            elif erase:
+                for col in range(x0, x1+1):
+                    buf[pos+col] = bg[src+col]
+            elif mask is None:
+                for col in range(x0, x1+1):
+                    bg[src+col] = buf[pos+col]
+                    buf[pos+col] |= data[base+src+col]
+            else:
+                for col in range(x0, x1+1):
+                    v = buf[pos+col]
+                    bg[src+col] = v
+                    m = mask[base+src+col]
+                    buf[pos+col] = (v & ~m & 0xFF) | (data[base+src+col] & m)
+            k += 1
+        self.display._mark_dirty(x0, x1, fp[2], fp[3])
+        return fp
+
+    def move(self, x, y):
+        """
+.. method:: move(x, y)
+
+        Draws the sprite with its left high corner at ``x``, ``y``, removing it from its previous position if visible.
+        Coordinates may be negative or beyond the screen size: the sprite is clipped.
+
+        :param x: x-coordinate of the left high corner
+        :param y: y-coordinate of the left high corner
+
+        """
+        d = self.display
+        old = None
+        if self.visible:
+            old = self._blit(self.x, self.y, True)
+        new = self._footprint(x, y)
+        if old is not None and new is not None:
+            # footprints are sent one by one when their bounding box would carry more bytes
+            # than both of them plus the setup of a second window
+            bx = old[1]
+            if new[1] > bx:
+                bx = new[1]
+            if old[0] < new[0]:
+                bx -= old[0]
+            else:
+                bx -= new[0]
+            by = old[3]
+            if new[3] > by:
+                by = new[3]
+            if old[2] < new[2]:
+                by -= old[2]
+            else:
+                by -= new[2]
+            size = (old[1]-old[0]+1)*(old[3]-old[2]+1) + (new[1]-new[0]+1)*(new[3]-new[2]+1)
+            if (bx+1)*(by+1) > size+8:
+                d._flush()
+        self.x = x
+        self.y = y
+        self._blit(x, y, False)
+        self.visible = True
+        d._flush()
+
+    def hide(self):
+        """
+.. method:: hide()
+
+        Removes the sprite from the screen, restoring the content under it.
+
+        """
+        if self.visible:
+            self._blit(self.x, self.y, True)
+            self.visible = False
+            self.display._flush()
+
+
+class Animation():
+    """
+.. class:: Animation(display, data, x, page, w, pages)
+
+    Creates a player of a delta encoded animation (e.g. a boot animation or a loading spinner) on an initialized :class:`SSD1306` display.
+
+    The animation data, produced by ``tools/ssd1306img.py -f delta`` from a sequence of images, holds the first frame in page format
+    (see :func:`SSD1306.draw_img_native()`) followed by the changes from each frame to the next one, the last of them leading back to the first frame.
+    Each step writes only the changed bytes into the frame buffer, and only the window enclosing them is sent to the display.
+
+    Change lists are made of runs: a byte ``skip`` with the number of unchanged bytes, a byte ``count`` with the number of changed bytes, and the ``count`` new bytes.
+    A run with ``count`` 0 and ``skip`` 255 skips 255 bytes; a run with both ``skip`` and ``count`` 0 ends the list of a frame.
+
+    :param display: the :class:`SSD1306` instance
+    :param data: animation data, preferably as bytes: they are read in place
+    :param x: x-coordinate for left high corner of the animation
+    :param page: page (row of 8 pixels) of the left high corner of the animation
+    :param w: width of the animation
+    :param pages: height of the animation in pages
+
+    Example: ::
+
+        import spinner
+        anim = ssd1306.Animation(oled, spinner.spinner, 56, 3, spinner.spinner_width, 2)
+        anim.play(30, loops=5)
+
+    """
+    def __init__(self, display, data, x, page, w, pages):
+        display._check_coordinates(x, page*8, w, pages*8)
+        self.display = display
+        self.data = data
+        self.x = x
+        self.page = page
+        self.w = w
+        self.pages = pages
+        # start of the change list of each frame
+        self._offsets = []
+        pos = w*pages
+        while pos < len(data):
+            self._offsets.append(pos)
+            while True:
+                skip = data[pos]
+                count = data[pos+1]
+                pos += 2+count
+                if count == 0 and skip == 0:
+                    break
+        self.frames = len(self._offsets)
+        self.frame = 0
+
+    def rewind(self):
+        """
+.. method:: rewind()
+
+        Draws the first frame of the animation.
+
+        """
+        d = self.display
+        buf = d._buf_display
+        width = d._screen_width
+        w = self.w
+        src = 0
+        for p in range(self.pages):
+            pos = (self.page+p)*width + self.x
+            for col in range(w):
+                buf[pos+col] = self.data[src]
+                src += 1
+        self.frame = 0
+        d._mark_dirty(self.x, self.x+w-1, self.page, self.page+self.pages-1)
+        d._flush()
+
+    def step(self):
+        """
+.. method:: step()
+
+        Draws the next frame of the animation, after the last one the first frame again. Returns the index of the frame drawn.
+
+        """
+        if self.frames == 0:
+            return 0
+        d = self.display
+        buf = d._buf_display
+        width = d._screen_width
+        data = self.data
+        w = self.w
+        pos = self._offsets[self.frame]
+        col = 0
+        p = 0
+        # bounding box of the changes, in columns and pages of the animation
+        x0 = w
+        x1 = -1
+        p0 = self.pages
+        p1 = -1
+        while True:
+            skip = data[pos]
+            count = data[pos+1]
+            pos += 2
+            if count == 0 and skip == 0:
+                break
+            col += skip
+            while col >= w:
+                col -= w
+                p += 1
+            if count == 0:
+                continue
+            if p < p0:
+                p0 = p
+            dst = (self.page+p)*width + self.x
+            while count > 0:
+                buf[dst+col] = data[pos]
+                if col < x0:
+                    x0 = col
+                if col > x1:
+                    x1 = col
+                pos += 1
+                count -= 1
+                col += 1
+                if col == w:
+                    col = 0
+                    p += 1
+                    dst += width
+            if col == 0:
+                p1 = p-1
+            else:
+                p1 = p
+        self.frame += 1
+        if self.frame == self.frames:
+            self.frame = 0
+        if x1 >= 0:
+            d._mark_dirty(self.x+x0, self.x+x1, self.page+p0, self.page+p1)
+            d._flush()
+        return self.frame
+
+    def play(self, fps, loops=1):
+        """
+.. method:: play(fps, loops=1)
+
+        Plays the animation from the first frame, waiting for its end.
+
+        Frames are paced on a fixed time grid, so that a late transfer is made up by a shorter wait before the next frame;
+        when late by more than a whole frame the grid is moved forward instead of drawing frames in a burst.
+
+        :param fps: frames per second
+        :param loops: number of times the animation is played, 0 to play it forever; default 1
+
+        """
+        d = self.display
+        period = 1000//fps
+        self.rewind()
+        if not d._auto_flush:
+            d.show()
+        n = loops*self.frames - 1
+        next_frame = timers.now()
+        while loops == 0 or n > 0:
+            next_frame += period
+            delay = next_frame - timers.now()
+            if delay > 0:
+                sleep(delay)
+            elif delay < -period:
+                next_frame = timers.now()
+            self.step()
+            if not d._auto_flush:
+                d.show()
+            n -= 1
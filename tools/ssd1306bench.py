@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""
+Benchmarks of the SSD1306 driver, run on the host against the simulated bus of
+``ssd1306sim.py``.
+
+For every public drawing method and for a few typical scenarios (a full dashboard,
+a clock tick, a logo draw and a contrast fade) the following are reported:
+
+* bus transactions, command bytes and data bytes of one call
+* bytes on the wire and transfer time at the default bus clock
+* Python level time of one call (best of several runs, host CPU)
+* peak memory allocated during one call
+
+The simulator runs on virtual time: ``sleep()`` in the driver advances a clock instead of
+waiting, so timed code like ``fade()`` is measured without its waits and sends the same
+commands at every run.
+
+Time and allocations are measured with the simulated panel only counting bytes, so
+that they include the driver and not the model of the controller.
+
+Bus figures are exact and don't depend on the host; times only make sense compared
+with other runs on the same machine. Results can be saved as JSON and compared with a
+previous run to catch regressions: ::
+
+    python3 ssd1306bench.py --json base.json
+    python3 ssd1306bench.py --compare base.json
+
+The comparison fails (exit status 1) if the bus usage of a case grows, or if its time or
+allocations grow beyond the given tolerance.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import ssd1306img  # noqa: E402
+import ssd1306sim  # noqa: E402
+
+CASES = []
+
+
+def case(name, auto_flush=True):
+    """Register ``fn(display, state)`` as a benchmark; ``state`` is a dict kept across calls,
+    holding the driver module as ``state["module"]``."""
+
+    def register(fn):
+        CASES.append((name, auto_flush, fn))
+        return fn
+
+    return register
+
+
+def _load_logo():
+    env = {}
+    path = os.path.join(ssd1306sim.ROOT, "examples", "fading_image", "zLogo.py")
+    with open(path) as f:
+        exec(f.read(), env)
+    row = bytes(env["zz"])
+    pixels = []
+    for y in range(32):
+        pixels.append([(row[y * 4 + (x >> 3)] >> (7 - (x & 7))) & 1 for x in range(32)])
+    bmp = ssd1306img.Bitmap(32, 32, pixels)
+    page = ssd1306img.to_page(bmp)
+    return row, page, ssd1306img.rle_encode(page)
+
+
+LOGO_ROW, LOGO_PAGE, LOGO_RLE = _load_logo()
+
+
+# public methods
+
+@case("init")
+def _(d, s):
+    d.init(128, 64)
+
+
+@case("clear")
+def _(d, s):
+    d.clear()
+
+
+@case("fill_screen")
+def _(d, s):
+    d.fill_screen()
+
+
+@case("fill_rect_small")
+def _(d, s):
+    d.fill_rect(10, 10, 8, 8)
+
+
+@case("fill_rect_large")
+def _(d, s):
+    d.fill_rect(4, 3, 100, 50)
+
+
+@case("draw_pixel")
+def _(d, s):
+    d.draw_pixel(64, 32)
+
+
+@case("draw_line")
+def _(d, s):
+    d.draw_line(0, 0, 127, 40)
+
+
+@case("draw_rect")
+def _(d, s):
+    d.draw_rect(10, 5, 100, 50)
+
+
+@case("draw_circle")
+def _(d, s):
+    d.draw_circle(64, 32, 20)
+
+
+@case("fill_circle")
+def _(d, s):
+    d.fill_circle(64, 32, 20)
+
+
+@case("draw_text")
+def _(d, s):
+    d.draw_text("Hello world", 0, 0, 0, 0)
+
+
+@case("draw_text_centered")
+def _(d, s):
+    d.draw_text("Temp 21.5C", 0, 20, 128, 16, align=3)
+
+
+@case("draw_textbox")
+def _(d, s):
+    d.draw_textbox("Battery low: connect the charger to go on", 0, 0, 96, 40, align=3, valign=0x30)
+
+
+@case("draw_img")
+def _(d, s):
+    d.draw_img(LOGO_ROW, 48, 16, 32, 32)
+
+
+@case("draw_img_native")
+def _(d, s):
+    d.draw_img_native(LOGO_PAGE, 48, 2, 32, 4)
+
+
+@case("draw_img_rle")
+def _(d, s):
+    d.draw_img_rle(LOGO_RLE, 48, 2, 32, 4)
+
+
+@case("set_contrast")
+def _(d, s):
+    d.set_contrast(0x40)
+
+
+@case("invert")
+def _(d, s):
+    d.invert()
+
+
+# scenarios
+
+@case("dashboard", auto_flush=False)
+def _(d, s):
+    d.clear()
+    d.draw_text("STATUS", 0, 0, 128, 10, align=3)
+    d.fill_rect(0, 11, 128, 1)
+    labels = ("CPU", "MEM", "NET")
+    values = (37, 62, 12)
+    for i in range(3):
+        y = 14 + i * 16
+        d.draw_text(labels[i], 0, y, 0, 0)
+        d.fill_rect(28, y + 2, values[i], 8)
+        d.draw_text("%d%%" % values[i], 100, y, 28, 12, align=2)
+    d.show()
+
+
+@case("clock_tick")
+def _(d, s):
+    t = s.get("t", 0)
+    s["t"] = t + 1
+    d.draw_text("12:%02d:%02d" % (t // 60 % 60, t % 60), 32, 24, 64, 16, align=3)
+
+
+@case("logo")
+def _(d, s):
+    d.clear()
+    d.draw_img(LOGO_ROW, 48, 16, 32, 32)
+
+
+@case("sprite_move")
+def _(d, s):
+    sprite = s.get("sprite")
+    if sprite is None:
+        ball = bytes([0x3C, 0x7E, 0xFF, 0xFF, 0xFF, 0xFF, 0x7E, 0x3C])
+        sprite = s["sprite"] = s["module"].Sprite(d, ball, 8, 8, mask=ball)
+        s["x"] = 0
+    s["x"] = (s["x"] + 3) % 120
+    sprite.move(s["x"], 20 + s["x"] % 13)
+
+
+@case("fade")
+def _(d, s):
+    d.fade(255, 0, 500)
+
+
+@case("hw_fade")
+def _(d, s):
+    d.hw_fade(s["module"].OLED_FADE_OUT, 16)
+
+
+def run_case(interface, name, auto_flush, fn, repeat):
+    # virtual time: timed cases (fade ramps) run instantly and send the same steps every run
+    sim = ssd1306sim.Simulator(interface, 128, 64, virtual_time=True)
+    d = sim.display()
+    d.init(128, 64, auto_flush=auto_flush)
+    d.on()
+    d.clear()
+    d.show()
+    state = {"module": sim.module}
+    # warm up: the first call loads fonts and fills caches
+    fn(d, state)
+    d.show()
+
+    sim.stats.reset()
+    fn(d, state)
+    d.show()
+    result = sim.stats.as_dict()
+
+    sim.panel.decode = False
+    best = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(d, state)
+        d.show()
+        dt = time.perf_counter() - t0
+        if best is None or dt < best:
+            best = dt
+    result["time"] = best
+
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    tracemalloc.reset_peak()
+    fn(d, state)
+    d.show()
+    result["peak_alloc"] = tracemalloc.get_traced_memory()[1] - base
+    tracemalloc.stop()
+    return result
+
+
+def run(interfaces, only=None, repeat=50):
+    results = {}
+    for interface in interfaces:
+        for name, auto_flush, fn in CASES:
+            if only and name not in only:
+                continue
+            results["%s/%s" % (interface, name)] = run_case(interface, name, auto_flush, fn, repeat)
+    return results
+
+
+def print_table(results, out=sys.stdout):
+    header = "%-26s %5s %6s %6s %7s %9s %10s %8s" % (
+        "case", "tx", "cmd", "data", "wire", "bus ms", "cpu us", "alloc")
+    print(header, file=out)
+    print("-" * len(header), file=out)
+    for key, r in results.items():
+        print("%-26s %5d %6d %6d %7d %9.3f %10.1f %8d" % (
+            key, r["transactions"], r["command_bytes"], r["data_bytes"], r["bus_bytes"],
+            r["bus_time"] * 1000, r["time"] * 1e6, r["peak_alloc"]), file=out)
+
+
+def compare(results, baseline, tolerance):
+    """Return the list of regressions of ``results`` with respect to ``baseline``."""
+    regressions = []
+    for key, r in results.items():
+        b = baseline.get(key)
+        if b is None:
+            continue
+        for field in ("transactions", "command_bytes", "data_bytes", "bus_bytes"):
+            if r[field] > b[field]:
+                regressions.append("%s: %s %d -> %d" % (key, field, b[field], r[field]))
+        for field in ("time", "peak_alloc"):
+            # small absolute slack: sub-microsecond noise and allocator granularity
+            slack = 2e-6 if field == "time" else 64
+            if r[field] > b[field] * (1 + tolerance) + slack:
+                regressions.append("%s: %s %g -> %g" % (key, field, b[field], r[field]))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the SSD1306 driver on a simulated bus.")
+    parser.add_argument("-i", "--interface", choices=("spi", "i2c", "both"), default="both")
+    parser.add_argument("-c", "--case", action="append", help="run only this case (repeatable)")
+    parser.add_argument("-r", "--repeat", type=int, default=50, help="timed runs per case, the best is kept")
+    parser.add_argument("--json", help="save the results to this file")
+    parser.add_argument("--compare", help="compare with the results saved in this file")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed relative growth of time and allocations (default 0.25)")
+    parser.add_argument("-l", "--list", action="store_true", help="list the cases and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name, _, _ in CASES:
+            print(name)
+        return 0
+    interfaces = ("spi", "i2c") if args.interface == "both" else (args.interface,)
+    results = run(interfaces, args.case, args.repeat)
+    print_table(results)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=1, sort_keys=True)
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        for line in regressions:
+            print("REGRESSION " + line, file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,470 @@
+#!/usr/bin/env python3
+"""
+Host side asset compiler for the SSD1306 driver.
+
+Converts PNG, PBM (P1/P4) and XBM images, or sequences of them, into Python modules
+(or raw binary blobs) ready to be drawn by the driver, in one of these formats:
+
+* ``row``: row-major 1bpp, MSB is the leftmost pixel; drawn with ``draw_img()``
+* ``page``: native page format, one byte per column for each 8 pixel rows, LSB on top;
+  drawn with ``draw_img_native()``
+* ``rle``: page format compressed with run-length encoding; drawn with ``draw_img_rle()``
+* ``delta``: for frame sequences, the first frame in page format followed by the changed
+  bytes from each frame to the next (the last one back to the first); played with the
+  driver's ``Animation`` class
+
+With ``-f auto`` (the default) the smallest of the ``row``, ``page`` and ``rle`` encodings is
+chosen for each asset, and the expected blit cost of every candidate is reported on stderr.
+
+RLE stream: a control byte ``c`` followed by data. If ``c < 0x80``, ``c+1`` literal bytes
+follow; otherwise the next byte is repeated ``c-0x80+3`` times.
+
+Delta stream: for each frame, runs of a ``skip`` byte (unchanged bytes), a ``count`` byte and
+``count`` new bytes; ``skip`` 255 with ``count`` 0 skips 255 bytes, ``skip`` and ``count`` 0
+end the frame.
+
+A pixel is lit when it is bright (luminance >= threshold) and opaque for PNG images, and when
+its bit is set for PBM and XBM images; ``--invert`` swaps lit and unlit pixels.
+If Pillow is installed it is used to read any other image format.
+
+Usage: ::
+
+    python3 ssd1306img.py logo.png -o logo.py
+    python3 ssd1306img.py -f page -n spinner frame*.png -o spinner.py
+    python3 ssd1306img.py -f rle --bin splash.png -o splash.bin
+    python3 ssd1306img.py -f delta -n boot boot*.png -o boot.py
+"""
+
+import argparse
+import re
+import struct
+import sys
+import zlib
+
+FORMATS = ("row", "page", "rle")
+# encodings of a whole sequence, chosen only explicitly
+SEQUENCE_FORMATS = ("delta",)
+
+
+class Bitmap:
+    """Monochrome image: ``pixels`` is a list of rows of 0/1 ints."""
+
+    def __init__(self, width, height, pixels):
+        self.width = width
+        self.height = height
+        self.pixels = pixels
+
+
+def _paeth(a, b, c):
+    p = a + b - c
+    pa, pb, pc = abs(p - a), abs(p - b), abs(p - c)
+    if pa <= pb and pa <= pc:
+        return a
+    if pb <= pc:
+        return b
+    return c
+
+
+def read_png(data, threshold):
+    if data[:8] != b"\x89PNG\r\n\x1a\n":
+        raise ValueError("not a PNG file")
+    pos = 8
+    idat = b""
+    palette = None
+    trns = None
+    while pos < len(data):
+        length, ctype = struct.unpack(">I4s", data[pos:pos + 8])
+        chunk = data[pos + 8:pos + 8 + length]
+        pos += 12 + length
+        if ctype == b"IHDR":
+            width, height, depth, color, _, _, interlace = struct.unpack(">IIBBBBB", chunk)
+        elif ctype == b"PLTE":
+            palette = [tuple(chunk[i:i + 3]) for i in range(0, len(chunk), 3)]
+        elif ctype == b"tRNS":
+            trns = chunk
+        elif ctype == b"IDAT":
+            idat += chunk
+        elif ctype == b"IEND":
+            break
+    if interlace:
+        raise ValueError("interlaced PNG images are not supported")
+    channels = {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}[color]
+    bpp = max(1, channels * depth // 8)
+    stride = (width * channels * depth + 7) // 8
+    raw = zlib.decompress(idat)
+    rows = []
+    prev = bytearray(stride)
+    pos = 0
+    for _ in range(height):
+        ftype = raw[pos]
+        line = bytearray(raw[pos + 1:pos + 1 + stride])
+        pos += 1 + stride
+        for i in range(stride):
+            a = line[i - bpp] if i >= bpp else 0
+            b = prev[i]
+            c = prev[i - bpp] if i >= bpp else 0
+            if ftype == 1:
+                line[i] = (line[i] + a) & 0xFF
+            elif ftype == 2:
+                line[i] = (line[i] + b) & 0xFF
+            elif ftype == 3:
+                line[i] = (line[i] + ((a + b) >> 1)) & 0xFF
+            elif ftype == 4:
+                line[i] = (line[i] + _paeth(a, b, c)) & 0xFF
+        rows.append(line)
+        prev = line
+    maxval = (1 << depth) - 1
+    pixels = []
+    for line in rows:
+        if depth < 8:
+            samples = []
+            for byte in line:
+                for shift in range(8 - depth, -1, -depth):
+                    samples.append((byte >> shift) & maxval)
+        elif depth == 16:
+            samples = [line[i] << 8 | line[i + 1] for i in range(0, len(line), 2)]
+        else:
+            samples = list(line)
+        out = []
+        for x in range(width):
+            s = samples[x * channels:(x + 1) * channels]
+            alpha = 255
+            if color == 3:
+                r, g, b = palette[s[0]]
+                if trns is not None and s[0] < len(trns):
+                    alpha = trns[s[0]]
+            else:
+                scale = 255.0 / maxval
+                if color in (0, 4):
+                    r = g = b = s[0] * scale
+                else:
+                    r, g, b = s[0] * scale, s[1] * scale, s[2] * scale
+                if color in (4, 6):
+                    alpha = s[-1] * scale
+            lum = 0.299 * r + 0.587 * g + 0.114 * b
+            out.append(1 if alpha >= 128 and lum >= threshold else 0)
+        pixels.append(out)
+    return Bitmap(width, height, pixels)
+
+
+def read_pbm(data):
+    tokens = []
+    pos = 0
+    # header: magic, width, height (comments allowed)
+    while len(tokens) < 3:
+        m = re.compile(rb"\s*(#[^\n]*\n\s*)*(\S+)").match(data, pos)
+        tokens.append(m.group(2))
+        pos = m.end()
+    magic, width, height = tokens[0], int(tokens[1]), int(tokens[2])
+    pixels = []
+    if magic == b"P4":
+        pos += 1
+        stride = (width + 7) // 8
+        for y in range(height):
+            line = data[pos + y * stride:pos + (y + 1) * stride]
+            pixels.append([(line[x >> 3] >> (7 - (x & 7))) & 1 for x in range(width)])
+    elif magic == b"P1":
+        bits = [c - 48 for c in re.sub(rb"#[^\n]*", b"", data[pos:]) if c in (48, 49)]
+        for y in range(height):
+            pixels.append(bits[y * width:(y + 1) * width])
+    else:
+        raise ValueError("unsupported PBM variant %r" % magic)
+    return Bitmap(width, height, pixels)
+
+
+def read_xbm(data):
+    text = data.decode("ascii", "replace")
+    width = int(re.search(r"_width\s+(\d+)", text).group(1))
+    height = int(re.search(r"_height\s+(\d+)", text).group(1))
+    values = [int(v, 16) for v in re.findall(r"0[xX]([0-9a-fA-F]+)", text[text.index("{"):])]
+    stride = (width + 7) // 8
+    pixels = []
+    for y in range(height):
+        line = values[y * stride:(y + 1) * stride]
+        pixels.append([(line[x >> 3] >> (x & 7)) & 1 for x in range(width)])
+    return Bitmap(width, height, pixels)
+
+
+def read_pillow(path, threshold):
+    from PIL import Image
+    img = Image.open(path).convert("LA")
+    width, height = img.size
+    pixels = []
+    for y in range(height):
+        row = []
+        for x in range(width):
+            lum, alpha = img.getpixel((x, y))
+            row.append(1 if alpha >= 128 and lum >= threshold else 0)
+        pixels.append(row)
+    return Bitmap(width, height, pixels)
+
+
+def load(path, threshold=128, invert=False):
+    with open(path, "rb") as f:
+        data = f.read()
+    if data[:8] == b"\x89PNG\r\n\x1a\n":
+        bmp = read_png(data, threshold)
+    elif data[:2] in (b"P1", b"P4"):
+        bmp = read_pbm(data)
+    elif b"_bits" in data and b"#define" in data:
+        bmp = read_xbm(data)
+    else:
+        try:
+            bmp = read_pillow(path, threshold)
+        except ImportError:
+            raise ValueError("%s: unsupported image format (install Pillow for more formats)" % path)
+    if invert:
+        bmp.pixels = [[1 - p for p in row] for row in bmp.pixels]
+    return bmp
+
+
+def to_row(bmp):
+    stride = (bmp.width + 7) // 8
+    out = bytearray(stride * bmp.height)
+    for y, row in enumerate(bmp.pixels):
+        for x, p in enumerate(row):
+            if p:
+                out[y * stride + (x >> 3)] |= 0x80 >> (x & 7)
+    return bytes(out)
+
+
+def to_page(bmp):
+    pages = (bmp.height + 7) // 8
+    out = bytearray(bmp.width * pages)
+    for y, row in enumerate(bmp.pixels):
+        for x, p in enumerate(row):
+            if p:
+                out[(y >> 3) * bmp.width + x] |= 1 << (y & 7)
+    return bytes(out)
+
+
+def rle_encode(data):
+    out = bytearray()
+    literal = bytearray()
+    i = 0
+    n = len(data)
+
+    def flush_literal():
+        while literal:
+            chunk = literal[:128]
+            out.append(len(chunk) - 1)
+            out.extend(chunk)
+            del literal[:128]
+
+    while i < n:
+        run = 1
+        while i + run < n and data[i + run] == data[i] and run < 130:
+            run += 1
+        if run >= 3:
+            flush_literal()
+            out.append(0x80 + run - 3)
+            out.append(data[i])
+            i += run
+        else:
+            literal.append(data[i])
+            i += 1
+    flush_literal()
+    return bytes(out)
+
+
+def rle_decode(data):
+    out = bytearray()
+    i = 0
+    while i < len(data):
+        c = data[i]
+        if c < 0x80:
+            out.extend(data[i + 1:i + 2 + c])
+            i += c + 2
+        else:
+            out.extend(data[i + 1:i + 2] * (c - 0x80 + 3))
+            i += 2
+    return bytes(out)
+
+
+def _delta(a, b):
+    out = bytearray()
+    n = len(a)
+    last = 0
+    i = 0
+    while i < n:
+        if a[i] == b[i]:
+            i += 1
+            continue
+        # extend the run over gaps of up to 2 unchanged bytes, cheaper than a new run header
+        j = i + 1
+        while j < n:
+            if a[j] != b[j]:
+                j += 1
+            elif j + 1 < n and a[j + 1] != b[j + 1]:
+                j += 2
+            elif j + 2 < n and a[j + 2] != b[j + 2]:
+                j += 3
+            else:
+                break
+        skip = i - last
+        while skip > 255:
+            out += b"\xff\x00"
+            skip -= 255
+        while i < j:
+            count = min(j - i, 255)
+            out.append(skip)
+            out.append(count)
+            out.extend(b[i:i + count])
+            i += count
+            skip = 0
+        last = i
+    out += b"\x00\x00"
+    return bytes(out)
+
+
+def delta_encode(frames):
+    """Encode a sequence of page format frames of the same size as a delta stream."""
+    out = bytearray(frames[0])
+    for i in range(len(frames)):
+        out.extend(_delta(frames[i], frames[(i + 1) % len(frames)]))
+    return bytes(out)
+
+
+def delta_decode(data, size):
+    """Return the frames of a delta stream, ``size`` bytes each (the last change list is not applied)."""
+    frame = bytearray(data[:size])
+    frames = [bytes(frame)]
+    pos = size
+    while pos < len(data):
+        i = 0
+        while True:
+            skip, count = data[pos], data[pos + 1]
+            pos += 2
+            if skip == 0 and count == 0:
+                break
+            i += skip
+            frame[i:i + count] = data[pos:pos + count]
+            i += count
+            pos += count
+        frames.append(bytes(frame))
+    return frames[:-1]
+
+
+def encode(bmp, fmt):
+    if fmt == "row":
+        return to_row(bmp)
+    if fmt == "page":
+        return to_page(bmp)
+    return rle_encode(to_page(bmp))
+
+
+def blit_cost(bmp, fmt, data):
+    """Rough per-draw cost: interpreted VM operations and frame buffer bytes touched."""
+    pages = (bmp.height + 7) // 8
+    touched = bmp.width * pages
+    if fmt == "row":
+        # one bit extraction per pixel plus one merged write per column and page band
+        ops = bmp.width * bmp.height + touched
+    elif fmt == "page":
+        # slice copies, one per page (or a single one for full width images)
+        ops = pages
+    else:
+        # one step per control byte plus a slice copy or a fill per run
+        ops = 0
+        i = 0
+        while i < len(data):
+            c = data[i]
+            i += c + 2 if c < 0x80 else 2
+            ops += 2
+    return ops, touched
+
+
+def choose(frames, fmt):
+    if fmt in SEQUENCE_FORMATS:
+        encoded = delta_encode([to_page(b) for b in frames])
+        # one step per run plus one write per changed byte
+        ops = len(encoded) - len(to_page(frames[0]))
+        return fmt, [encoded], [(fmt, len(encoded), ops, len(to_page(frames[0])))]
+    candidates = FORMATS if fmt == "auto" else (fmt,)
+    report = []
+    best = None
+    for f in candidates:
+        encoded = [encode(b, f) for b in frames]
+        size = sum(len(e) for e in encoded)
+        ops = sum(blit_cost(b, f, e)[0] for b, e in zip(frames, encoded))
+        report.append((f, size, ops, blit_cost(frames[0], f, encoded[0])[1]))
+        # smallest encoding wins, ties go to the cheapest blit
+        if best is None or (size, ops) < (best[1], best[2]):
+            best = (f, size, ops, encoded)
+    return best[0], best[3], report
+
+
+def _bytes_literal(data, indent="    ", per_line=16):
+    lines = []
+    for i in range(0, len(data), per_line):
+        lines.append(indent + 'b"' + "".join("\\x%02X" % b for b in data[i:i + per_line]) + '"')
+    return "\n".join(lines) if lines else indent + 'b""'
+
+
+def write_module(out, name, fmt, bmp, encoded, sources, nframes=1):
+    pages = (bmp.height + 7) // 8
+    ref = name if len(encoded) == 1 else name + "[i]"
+    call = {
+        "row": "ssd.draw_img(%s, x, y, %d, %d)" % (ref, bmp.width, bmp.height),
+        "page": "ssd.draw_img_native(%s, x, page, %d, %d)" % (ref, bmp.width, pages),
+        "rle": "ssd.draw_img_rle(%s, x, page, %d, %d)" % (ref, bmp.width, pages),
+        "delta": "ssd1306.Animation(ssd, %s, x, page, %d, %d).play(fps)" % (ref, bmp.width, pages),
+    }[fmt]
+    out.write("# Generated by ssd1306img.py from %s\n" % ", ".join(sources))
+    out.write("# %dx%d, %s format, %d bytes\n" % (bmp.width, bmp.height, fmt, sum(len(e) for e in encoded)))
+    out.write("# usage: %s\n\n" % call)
+    out.write("%s_width = %d\n" % (name, bmp.width))
+    out.write("%s_height = %d\n" % (name, bmp.height))
+    if fmt in SEQUENCE_FORMATS:
+        out.write("%s_frames = %d\n" % (name, nframes))
+    out.write('%s_format = "%s"\n\n' % (name, fmt))
+    if len(encoded) == 1:
+        out.write("%s = (\n%s\n)\n" % (name, _bytes_literal(encoded[0])))
+    else:
+        out.write("%s = [\n" % name)
+        for e in encoded:
+            out.write("  (\n%s\n  ),\n" % _bytes_literal(e))
+        out.write("]\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Convert images into SSD1306 driver assets")
+    parser.add_argument("images", nargs="+", help="input images; several images make a frame sequence")
+    parser.add_argument("-o", "--output", help="output file (default: stdout)")
+    parser.add_argument("-n", "--name", help="variable name (default: first input file name)")
+    parser.add_argument("-f", "--format", default="auto", choices=("auto",) + FORMATS + SEQUENCE_FORMATS)
+    parser.add_argument("-t", "--threshold", type=int, default=128, help="luminance threshold for lit pixels (0-255)")
+    parser.add_argument("-i", "--invert", action="store_true", help="swap lit and unlit pixels")
+    parser.add_argument("--bin", action="store_true", help="write a raw binary blob instead of a Python module")
+    args = parser.parse_args(argv)
+
+    frames = [load(p, args.threshold, args.invert) for p in args.images]
+    for f in frames[1:]:
+        if (f.width, f.height) != (frames[0].width, frames[0].height):
+            parser.error("all the frames of a sequence must have the same size")
+    if frames[0].width > 128 or frames[0].height > 64:
+        parser.error("images can't be larger than 128x64")
+    name = args.name or re.sub(r"\W", "_", args.images[0].rsplit("/", 1)[-1].rsplit(".", 1)[0])
+
+    fmt, encoded, report = choose(frames, args.format)
+    sys.stderr.write("%-6s %10s %12s %14s\n" % ("format", "bytes", "blit ops", "buffer bytes"))
+    for f, size, ops, touched in report:
+        sys.stderr.write("%-6s %10d %12d %14d%s\n" % (f, size, ops, touched, "  <-" if f == fmt else ""))
+
+    if args.bin:
+        data = b"".join(encoded)
+        if args.output:
+            with open(args.output, "wb") as out:
+                out.write(data)
+        else:
+            sys.stdout.buffer.write(data)
+    elif args.output:
+        with open(args.output, "w") as out:
+            write_module(out, name, fmt, frames[0], encoded, args.images, len(frames))
+    else:
+        write_module(sys.stdout, name, fmt, frames[0], encoded, args.images, len(frames))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
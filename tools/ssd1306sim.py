@@ -0,0 +1,529 @@
+#!/usr/bin/env python3
+"""
+Host side simulator for the SSD1306 driver.
+
+Runs ``ssd1306.py`` unchanged on a development machine: the ``#-if`` directives are
+resolved as the Zerynth compiler does, the ``spi``/``i2c``/``timers`` modules and the VM
+builtins (``pinMode``, ``digitalWrite``, ``sleep``, ``thread``) are replaced by host
+versions, and every byte written on the bus is fed to a model of the controller.
+
+The model interprets the SSD1306 command stream: page, horizontal and vertical addressing
+modes with their column/page windows, display start line and offset, multiplex ratio,
+segment remap and COM scan direction, contrast, inverted and entire-on display, display
+on/off, and horizontal/diagonal scrolling (advanced explicitly with ``Panel.step()``).
+The visible frame can be dumped as ASCII art, PBM or PNG, and bus usage is counted so
+that render paths can be compared without hardware; ``test_ssd1306.py`` uses it to check
+every render path against the driver's frame buffer.
+
+The frame is reported upright for the remap (0xA1) and COM scan (0xC8) setup used by the
+driver; a narrower glass is wired to the last columns of the controller, as assumed by
+the driver's column offset.
+
+Usage: ::
+
+    python3 ssd1306sim.py demo.py
+    python3 ssd1306sim.py -i i2c -s 96x40 demo.py -o frame.png
+
+The script is run with ``sim``, ``ssd1306``, ``fonts`` and ``display`` (an ``SSD1306``
+instance, not yet initialized) in its globals. From Python: ::
+
+    sim = Simulator("spi", 128, 64)
+    oled = sim.display()
+    oled.init(128, 64)
+    oled.draw_text("Hello", 0, 0, 0, 0)
+    print(sim.panel.to_ascii())
+"""
+
+import argparse
+import os
+import random
+import re
+import struct
+import sys
+import threading
+import time
+import types
+import zlib
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+RAM_COLUMNS = 128
+RAM_PAGES = 8
+
+# number of argument bytes of the commands that take any
+_ARGS = {
+    0x20: 1, 0x21: 2, 0x22: 2, 0x23: 1, 0x26: 6, 0x27: 6, 0x29: 5, 0x2A: 5,
+    0x81: 1, 0x8D: 1, 0xA3: 2, 0xA8: 1, 0xD3: 1, 0xD5: 1, 0xD9: 1, 0xDA: 1, 0xDB: 1,
+}
+
+
+def preprocess(src, flags):
+    """Resolve the ``#-if``/``#-else``/``#-endif`` directives (any number of ``#``)."""
+    out = []
+    stack = []
+    for line in src.splitlines():
+        m = re.match(r"^\s*#+-(if|else|endif)\b\s*(\w+)?", line)
+        if m:
+            kw = m.group(1)
+            if kw == "if":
+                parent = all(active for active, _ in stack)
+                stack.append((parent and bool(flags.get(m.group(2))), parent))
+            elif kw == "else":
+                active, parent = stack[-1]
+                stack[-1] = (parent and not active, parent)
+            else:
+                stack.pop()
+            # keep line numbers of tracebacks in sync with the source
+            out.append("")
+            continue
+        out.append(line if all(active for active, _ in stack) else "")
+    return "\n".join(out) + "\n"
+
+
+class Stats:
+    """Bus usage counters."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.transactions = 0
+        self.command_bytes = 0
+        self.data_bytes = 0
+        # bytes on the wire, including I2C address and control bytes
+        self.bus_bytes = 0
+        # transfer time at the configured bus clock, in seconds
+        self.bus_time = 0.0
+
+    def as_dict(self):
+        return {
+            "transactions": self.transactions,
+            "command_bytes": self.command_bytes,
+            "data_bytes": self.data_bytes,
+            "bus_bytes": self.bus_bytes,
+            "bus_time": self.bus_time,
+        }
+
+
+class Panel:
+    """Model of the SSD1306 controller and of the glass wired to it."""
+
+    def __init__(self, width=128, height=64, column_offset=None, seed=0):
+        if width > RAM_COLUMNS or height > RAM_PAGES * 8:
+            raise ValueError("panel larger than the controller RAM")
+        self.width = width
+        self.height = height
+        self.column_offset = RAM_COLUMNS - width if column_offset is None else column_offset
+        self.stats = Stats()
+        self.log = None
+        # when False bytes are only counted: the RAM and registers are left untouched
+        self.decode = True
+        self._seed = seed
+        self.reset()
+
+    def reset(self):
+        """Hardware reset: registers go back to their defaults, RAM content is undefined."""
+        rnd = random.Random(self._seed)
+        self.ram = bytearray(rnd.getrandbits(8) for _ in range(RAM_COLUMNS * RAM_PAGES))
+        self.mode = 2
+        self.col = 0
+        self.page = 0
+        self.col_start, self.col_end = 0, RAM_COLUMNS - 1
+        self.page_start, self.page_end = 0, RAM_PAGES - 1
+        self.start_line = 0
+        self.display_offset = 0
+        self.mux = 64
+        self.segment_remap = False
+        self.com_scan_dec = False
+        self.contrast = 0x7F
+        self.inverted = False
+        self.entire_on = False
+        self.display_on = False
+        self.fade = 0
+        self.scroll = None
+        self.scroll_active = False
+        self.scroll_area = (0, 64)
+        self.scroll_voffset = 0
+        self._pending = None
+
+    # bus side
+
+    def command(self, data):
+        if not self.decode:
+            self.stats.command_bytes += len(data)
+            return
+        for b in data:
+            self.stats.command_bytes += 1
+            if self._pending is not None:
+                self._pending[1].append(b)
+                if len(self._pending[1]) == _ARGS[self._pending[0]]:
+                    cmd, args = self._pending
+                    self._pending = None
+                    self._execute(cmd, args)
+            elif b in _ARGS:
+                self._pending = (b, [])
+            else:
+                self._execute(b, [])
+        if self.log is not None:
+            self.log.append(("cmd", bytes(data)))
+
+    def data(self, data):
+        if not self.decode:
+            self.stats.data_bytes += len(data)
+            return
+        for b in data:
+            self.stats.data_bytes += 1
+            self.ram[self.page * RAM_COLUMNS + self.col] = b
+            self._advance()
+        if self.log is not None:
+            self.log.append(("data", bytes(data)))
+
+    def _advance(self):
+        if self.mode == 0:
+            if self.col == self.col_end:
+                self.col = self.col_start
+                self.page = self.page_start if self.page == self.page_end else self.page + 1
+            else:
+                self.col = (self.col + 1) % RAM_COLUMNS
+        elif self.mode == 1:
+            if self.page == self.page_end:
+                self.page = self.page_start
+                self.col = self.col_start if self.col == self.col_end else self.col + 1
+            else:
+                self.page = (self.page + 1) % RAM_PAGES
+        else:
+            # page addressing: the column pointer wraps, the page is left unchanged
+            self.col = (self.col + 1) % RAM_COLUMNS
+
+    def _execute(self, c, a):
+        if c < 0x10:
+            self.col = (self.col & 0xF0) | c
+        elif c < 0x20:
+            self.col = (self.col & 0x0F) | ((c & 0x07) << 4)
+        elif c == 0x20:
+            self.mode = a[0] & 0x03
+        elif c == 0x21:
+            self.col_start, self.col_end = a[0] & 0x7F, a[1] & 0x7F
+            self.col = self.col_start
+        elif c == 0x22:
+            self.page_start, self.page_end = a[0] & 0x07, a[1] & 0x07
+            self.page = self.page_start
+        elif c == 0x23:
+            self.fade = a[0]
+        elif c in (0x26, 0x27):
+            self.scroll = (c, a[1] & 0x07, a[2] & 0x07, a[3] & 0x07, 0)
+        elif c in (0x29, 0x2A):
+            self.scroll = (c, a[1] & 0x07, a[2] & 0x07, a[3] & 0x07, a[4] & 0x3F)
+        elif c == 0x2E:
+            self.scroll_active = False
+            self.scroll_voffset = 0
+        elif c == 0x2F:
+            self.scroll_active = self.scroll is not None
+        elif 0x40 <= c < 0x80:
+            self.start_line = c - 0x40
+        elif c == 0x81:
+            self.contrast = a[0]
+        elif c == 0x8D:
+            pass
+        elif c in (0xA0, 0xA1):
+            self.segment_remap = c == 0xA1
+        elif c == 0xA3:
+            self.scroll_area = (a[0] & 0x3F, a[1] & 0x7F)
+        elif c in (0xA4, 0xA5):
+            self.entire_on = c == 0xA5
+        elif c in (0xA6, 0xA7):
+            self.inverted = c == 0xA7
+        elif c == 0xA8:
+            self.mux = (a[0] & 0x3F) + 1
+        elif c in (0xAE, 0xAF):
+            self.display_on = c == 0xAF
+        elif 0xB0 <= c <= 0xB7:
+            self.page = c & 0x07
+        elif c in (0xC0, 0xC8):
+            self.com_scan_dec = c == 0xC8
+        elif c == 0xD3:
+            self.display_offset = a[0] & 0x3F
+        # clock, precharge, COM pins, VCOMH and NOP only affect the analog side
+
+    # scrolling
+
+    def step(self, steps=1):
+        """Advance an active scroll by ``steps`` scroll steps (one column each)."""
+        if not self.scroll_active:
+            return
+        cmd, start, _, end, voffset = self.scroll
+        right = cmd in (0x26, 0x29)
+        for _ in range(steps):
+            for page in range(start, end + 1):
+                row = self.ram[page * RAM_COLUMNS:(page + 1) * RAM_COLUMNS]
+                if right:
+                    row = row[-1:] + row[:-1]
+                else:
+                    row = row[1:] + row[:1]
+                self.ram[page * RAM_COLUMNS:(page + 1) * RAM_COLUMNS] = row
+            self.scroll_voffset += voffset
+
+    # frame
+
+    def pixel_ram(self, x, y):
+        """Value of the bit of GDDRAM at column ``x``, row ``y``."""
+        return (self.ram[(y >> 3) * RAM_COLUMNS + x] >> (y & 7)) & 1
+
+    def frame(self):
+        """Visible frame as a list of rows of 0/1 ints, as lit on the glass."""
+        rows = []
+        top, area = self.scroll_area
+        for r in range(self.height):
+            if not self.display_on or r >= self.mux:
+                rows.append([0] * self.width)
+                continue
+            if self.entire_on:
+                rows.append([1] * self.width)
+                continue
+            src = r if self.com_scan_dec else self.height - 1 - r
+            if self.scroll_active and area and top <= src < top + area:
+                src = top + (src - top + self.scroll_voffset) % area
+            y = (src + self.start_line + self.display_offset) % 64
+            row = []
+            for c in range(self.width):
+                x = self.column_offset + (c if self.segment_remap else self.width - 1 - c)
+                row.append(self.pixel_ram(x, y) ^ self.inverted)
+            rows.append(row)
+        return rows
+
+    def to_ascii(self, on="#", off="."):
+        return "\n".join("".join(on if p else off for p in row) for row in self.frame())
+
+    def to_pbm(self):
+        out = bytearray(b"P4\n%d %d\n" % (self.width, self.height))
+        for row in self.frame():
+            for i in range(0, self.width, 8):
+                b = 0
+                for k, p in enumerate(row[i:i + 8]):
+                    b |= p << (7 - k)
+                out.append(b)
+        return bytes(out)
+
+    def to_png(self, scale=1):
+        # grayscale: lit pixels are shaded by the contrast setting
+        lit = 0x40 + (self.contrast * 0xBF) // 0xFF
+        raw = bytearray()
+        for row in self.frame():
+            line = bytearray()
+            for p in row:
+                line.extend(bytes([lit if p else 0]) * scale)
+            for _ in range(scale):
+                raw.append(0)
+                raw.extend(line)
+
+        def chunk(tag, body):
+            return struct.pack(">I", len(body)) + tag + body + struct.pack(">I", zlib.crc32(tag + body) & 0xFFFFFFFF)
+
+        ihdr = struct.pack(">IIBBBBB", self.width * scale, self.height * scale, 8, 0, 0, 0, 0)
+        return b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", ihdr) + chunk(b"IDAT", zlib.compress(bytes(raw))) + chunk(b"IEND", b"")
+
+    def save(self, path, scale=1):
+        """Write the frame to ``path``: PNG, PBM or ASCII art, chosen by the extension."""
+        ext = os.path.splitext(path)[1].lower()
+        if ext == ".png":
+            data = self.to_png(scale)
+        elif ext == ".pbm":
+            data = self.to_pbm()
+        else:
+            data = (self.to_ascii() + "\n").encode()
+        with open(path, "wb") as f:
+            f.write(data)
+
+
+class Simulator:
+    """Driver module loaded on top of a simulated bus and panel."""
+
+    def __init__(self, interface="spi", width=128, height=64, column_offset=None, driver=None,
+                 virtual_time=False):
+        if interface not in ("spi", "i2c"):
+            raise ValueError("interface must be spi or i2c")
+        self.interface = interface
+        self.panel = Panel(width, height, column_offset)
+        self.pins = {}
+        # with virtual time sleep() only advances the clock read by timers.now(), in ms:
+        # timed code runs instantly and repeatably, but can't wait for other threads
+        self.clock = 0 if virtual_time else None
+        self._reset_pins = set()
+        self.module = self._load(driver or os.path.join(ROOT, "ssd1306.py"))
+
+    @property
+    def stats(self):
+        return self.panel.stats
+
+    def display(self, *args, **kwargs):
+        """Create an ``SSD1306`` instance; bus and pin names are placeholders on the host."""
+        if not args:
+            args = ("SPI0", "CS", "RST", "DC") if self.interface == "spi" else ("I2C0",)
+        # pulling the reset pin low resets the panel
+        if self.interface == "spi":
+            self._reset_pins.add(args[2] if len(args) > 2 else kwargs.get("rst"))
+        else:
+            self._reset_pins.add(args[1] if len(args) > 1 else kwargs.get("rst"))
+        return self.module.SSD1306(*args, **kwargs)
+
+    # host versions of the VM builtins and peripherals
+
+    def _now(self):
+        if self.clock is not None:
+            return self.clock
+        return int(time.monotonic() * 1000)
+
+    def _sleep(self, ms):
+        if self.clock is not None:
+            self.clock += ms
+        else:
+            time.sleep(ms / 1000.0)
+
+    def _digital_write(self, pin, value):
+        if value == 0 and self.pins.get(pin) and pin in self._reset_pins:
+            self.panel.reset()
+        self.pins[pin] = value
+
+    def _bus_classes(self):
+        sim = self
+        panel = self.panel
+
+        class Spi:
+            def __init__(self, cs, drv, clock=8000000):
+                self._clock = clock
+
+            def select(self):
+                pass
+
+            def unselect(self):
+                pass
+
+            def write(self, data):
+                panel.stats.transactions += 1
+                panel.stats.bus_bytes += len(data)
+                panel.stats.bus_time += len(data) * 8.0 / self._clock
+                if sim.pins.get(self.dc):
+                    panel.data(data)
+                else:
+                    panel.command(data)
+
+        class I2C:
+            def __init__(self, drv, addr, clock=400000):
+                self._clock = clock
+
+            def start(self):
+                pass
+
+            def write(self, data):
+                panel.stats.transactions += 1
+                # address byte, then 9 clocks per byte (ACK included)
+                panel.stats.bus_bytes += len(data) + 1
+                panel.stats.bus_time += (len(data) + 1) * 9.0 / self._clock
+                if not panel.decode:
+                    # count without copying; the driver sends a single control byte
+                    if data[0] & 0x40:
+                        panel.stats.data_bytes += len(data) - 1
+                    else:
+                        panel.stats.command_bytes += len(data) - 1
+                    return
+                data = bytes(data)
+                i = 0
+                while i < len(data):
+                    control = data[i]
+                    sink = panel.data if control & 0x40 else panel.command
+                    if control & 0x80:
+                        # Co set: a single byte follows, then another control byte
+                        sink(data[i + 1:i + 2])
+                        i += 2
+                    else:
+                        sink(data[i + 1:])
+                        break
+
+        return Spi, I2C
+
+    def _load(self, path):
+        Spi, I2C = self._bus_classes()
+        spi = types.ModuleType("spi")
+        spi.Spi = Spi
+        i2c = types.ModuleType("i2c")
+        i2c.I2C = I2C
+        timers = types.ModuleType("timers")
+        timers.now = self._now
+
+        pkg = sys.modules.setdefault("solomon", types.ModuleType("solomon"))
+        pkg.__path__ = []
+        sub = sys.modules.setdefault("solomon.ssd1306", types.ModuleType("solomon.ssd1306"))
+        sub.__path__ = []
+        pkg.ssd1306 = sub
+        if "solomon.ssd1306.fonts" not in sys.modules:
+            fonts = types.ModuleType("solomon.ssd1306.fonts")
+            fonts_path = os.path.join(os.path.dirname(path), "fonts.py")
+            with open(fonts_path) as f:
+                exec(compile(f.read(), fonts_path, "exec"), fonts.__dict__)
+            sys.modules["solomon.ssd1306.fonts"] = fonts
+        sub.fonts = sys.modules["solomon.ssd1306.fonts"]
+        sys.modules.update({"spi": spi, "i2c": i2c, "timers": timers})
+
+        def thread(fn, *args):
+            t = threading.Thread(target=fn, args=args, daemon=True)
+            t.start()
+            return t
+
+        def pin_mode(pin, mode):
+            self.pins.setdefault(pin, 0)
+
+        mod = types.ModuleType("solomon.ssd1306.ssd1306")
+        mod.__dict__.update({
+            "pinMode": pin_mode,
+            "digitalWrite": self._digital_write,
+            "sleep": self._sleep,
+            "thread": thread,
+            "OUTPUT": 1,
+            "INPUT": 0,
+            "HIGH": 1,
+            "LOW": 0,
+            "PeripheralError": IOError,
+            "UnsupportedError": NotImplementedError,
+        })
+        flags = {"SSD1306SPI": self.interface == "spi", "SSD1306I2C": self.interface == "i2c"}
+        with open(path, newline="") as f:
+            src = preprocess(f.read(), flags)
+        exec(compile(src, path, "exec"), mod.__dict__)
+        return mod
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run a script against a simulated SSD1306 and dump the frame.")
+    parser.add_argument("script", help="python script using the predefined 'display'")
+    parser.add_argument("-i", "--interface", choices=("spi", "i2c"), default="spi")
+    parser.add_argument("-s", "--size", default="128x64", help="panel size, WIDTHxHEIGHT (default 128x64)")
+    parser.add_argument("-o", "--output", help="output file: .png, .pbm or text (default: ASCII on stdout)")
+    parser.add_argument("--scale", type=int, default=1, help="PNG pixel scale")
+    args = parser.parse_args(argv)
+
+    width, height = (int(v) for v in args.size.lower().split("x"))
+    sim = Simulator(args.interface, width, height)
+    env = {
+        "__name__": "__main__",
+        "sim": sim,
+        "ssd1306": sim.module,
+        "fonts": sys.modules["solomon.ssd1306.fonts"],
+        "display": sim.display(),
+    }
+    with open(args.script) as f:
+        exec(compile(f.read(), args.script, "exec"), env)
+    if env["display"].__dict__.get("_flush_request") is not None:
+        env["display"].wait_flush()
+
+    if args.output:
+        sim.panel.save(args.output, args.scale)
+    else:
+        print(sim.panel.to_ascii())
+    s = sim.stats
+    print("%d transactions, %d command bytes, %d data bytes, %d bus bytes, %.3f ms on the bus"
+          % (s.transactions, s.command_bytes, s.data_bytes, s.bus_bytes, s.bus_time * 1000), file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
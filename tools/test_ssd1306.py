@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+"""
+Regression tests of the SSD1306 driver, run on the host against ``ssd1306sim.py``.
+
+Every render path is exercised on both buses and on a full and a narrower panel, and the
+frame lit on the simulated glass is compared pixel by pixel with the driver's frame
+buffer: a missing or misplaced transfer shows up as a difference. ::
+
+    python3 -m unittest -v test_ssd1306
+    python3 -m pytest tools
+"""
+
+import os
+import sys
+import time
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import ssd1306img  # noqa: E402
+import ssd1306sim  # noqa: E402
+
+INTERFACES = ("spi", "i2c")
+SIZES = ((128, 64), (96, 40))
+
+# 8x8 ball in page format (also its own mask) and an 8x12 arrow, whose last page is half used
+BALL = bytes([0x3C, 0x7E, 0xFF, 0xFF, 0xFF, 0xFF, 0x7E, 0x3C])
+ARROW = bytes([0x08, 0x1C, 0x3E, 0x7F, 0x1C, 0x1C, 0x1C, 0x1C,
+               0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF])
+
+
+def pattern(n, seed=1):
+    """Deterministic pseudo random bytes, with runs so that RLE has something to do."""
+    out = bytearray(n)
+    v = seed
+    for i in range(n):
+        v = (v * 1103515245 + 12345) & 0x7FFFFFFF
+        out[i] = 0 if (v >> 16) % 5 == 0 else (v >> 8) & 0xFF
+    return bytes(out)
+
+
+def buffer_rows(display):
+    """Frame buffer of ``display`` as rows of 0/1 ints, in the layout of ``Panel.frame()``."""
+    w = display._screen_width
+    buf = display._buf_display
+    return [[(buf[(y >> 3) * w + x] >> (y & 7)) & 1 for x in range(w)]
+            for y in range(display._screen_height)]
+
+
+class DriverTest(unittest.TestCase):
+
+    def make(self, interface="spi", width=128, height=64, **kwargs):
+        sim = ssd1306sim.Simulator(interface, width, height)
+        d = sim.display()
+        d.init(width, height, **kwargs)
+        d.on()
+        return sim, d
+
+    def displays(self, **kwargs):
+        """One initialized display for each bus and panel size."""
+        out = []
+        for interface in INTERFACES:
+            for width, height in SIZES:
+                out.append(self.make(interface, width, height, **kwargs))
+        return out
+
+    def assertShown(self, sim, d):
+        d.wait_flush()
+        self.assertEqual(sim.panel.frame(), buffer_rows(d),
+                         "%s %dx%d: glass differs from the frame buffer" % (sim.interface, sim.panel.width, sim.panel.height))
+
+    def assertUnchanged(self, d, before):
+        self.assertEqual(len(d._buf_display), len(before))
+        self.assertEqual(bytes(d._buf_display), before)
+
+
+class TestFill(DriverTest):
+
+    def test_fill_rect(self):
+        for sim, d in self.displays():
+            w, h = d._screen_width, d._screen_height
+            ref = [[0] * w for _ in range(h)]
+            rnd = pattern(400, 7)
+            for i in range(0, 400, 5):
+                x = rnd[i] % w
+                y = rnd[i + 1] % h
+                rw = 1 + rnd[i + 2] % (w - x)
+                rh = 1 + rnd[i + 3] % (h - y)
+                fill = rnd[i + 4] & 1
+                d.fill_rect(x, y, rw, rh, fill)
+                for row in range(y, y + rh):
+                    for col in range(x, x + rw):
+                        ref[row][col] = fill
+            self.assertEqual(buffer_rows(d), ref)
+            self.assertShown(sim, d)
+
+    def test_clear_and_fill_screen(self):
+        for sim, d in self.displays():
+            d.fill_screen()
+            self.assertShown(sim, d)
+            self.assertEqual(set(d._buf_display), {0xFF})
+            d.clear()
+            self.assertShown(sim, d)
+            self.assertEqual(set(d._buf_display), {0})
+
+    def test_primitives(self):
+        for sim, d in self.displays():
+            d.draw_pixel(3, 4)
+            d.draw_line(0, 0, d._screen_width - 1, d._screen_height - 1)
+            d.draw_rect(5, 5, 30, 20)
+            d.draw_round_rect(40, 2, 30, 20, 5)
+            d.draw_circle(20, 20, 10)
+            d.fill_circle(60, 25, 8, False)
+            self.assertShown(sim, d)
+
+    def test_out_of_screen(self):
+        sim, d = self.make()
+        before = bytes(d._buf_display)
+        for args in ((120, 0, 10, 1), (0, 60, 1, 10), (128, 0, 1, 1)):
+            self.assertRaises(ValueError, d.fill_rect, *args)
+        self.assertRaises(ValueError, d.draw_circle, 64, 32, -1)
+        self.assertRaises(ValueError, d.fill_circle, 64, 32, -1)
+        self.assertRaises(ValueError, d.draw_circle, 5, 32, 10)
+        self.assertUnchanged(d, before)
+
+
+class TestText(DriverTest):
+
+    def test_draw_text(self):
+        for sim, d in self.displays():
+            d.fill_screen()
+            d.draw_text("Hello", 0, 0, 0, 0)
+            d.draw_text("42", 10, 20, 50, 16, align=2, fill=False)
+            d.draw_text("Center", 0, 24, d._screen_width, 16)
+            self.assertShown(sim, d)
+
+    def test_text_box_outside_untouched(self):
+        sim, d = self.make()
+        d.fill_screen()
+        d.draw_text("ab", 20, 10, 40, 14)
+        rows = buffer_rows(d)
+        for y in range(64):
+            for x in range(128):
+                if not (20 <= x < 60 and 10 <= y < 24):
+                    self.assertEqual(rows[y][x], 1)
+        self.assertShown(sim, d)
+
+    def test_draw_textbox(self):
+        text = "Battery low: connect the charger to go on"
+        for sim, d in self.displays():
+            d.fill_screen()
+            d.draw_textbox(text, 2, 3, 70, 36, align=3, valign=0x30)
+            d.draw_textbox(text, 0, 0, 40, 12, wrap=False, fill=False)
+            self.assertShown(sim, d)
+            rows = buffer_rows(d)
+            for y in range(d._screen_height):
+                for x in range(d._screen_width):
+                    if not (2 <= x < 72 and 3 <= y < 39) and not (x < 40 and y < 12):
+                        self.assertEqual(rows[y][x], 1)
+
+    def test_set_font(self):
+        fonts = sys.modules["solomon.ssd1306.fonts"]
+        sim, d = self.make()
+        d.set_font(fonts.guiFont_Tahoma_7_Regular)
+        d.draw_text("abc", 0, 0, 0, 0)
+        self.assertIs(d.font, fonts.guiFont_Tahoma_7_Regular)
+        self.assertShown(sim, d)
+
+
+class TestImages(DriverTest):
+
+    def test_draw_img(self):
+        row = pattern(4 * 32)
+        for sim, d in self.displays():
+            d.draw_img(row, 3, 5, 32, 32)
+            d.draw_img(row, 40, 0, 32, 32, mode=2)
+            self.assertShown(sim, d)
+
+    def test_draw_img_native(self):
+        for sim, d in self.displays():
+            w = d._screen_width
+            pages = d._screen_height >> 3
+            full = pattern(w * pages, 3)
+            d.draw_img_native(full, 0, 0, w, pages)
+            self.assertEqual(bytes(d._buf_display), full)
+            self.assertShown(sim, d)
+            # longer buffers are cut, the frame buffer keeps its size
+            d.draw_img_native(full + b"\x55\x55", 0, 0, w, pages)
+            self.assertEqual(bytes(d._buf_display), full)
+            icon = pattern(32, 5)
+            d.draw_img_native(icon, 7, 1, 16, 2)
+            d.draw_img_native(icon, 30, 2, 16, 2, mode=2)
+            self.assertShown(sim, d)
+
+    def test_draw_img_native_short(self):
+        sim, d = self.make()
+        before = bytes(d._buf_display)
+        self.assertRaises(ValueError, d.draw_img_native, bytes(31), 0, 0, 16, 2)
+        self.assertUnchanged(d, before)
+
+    def test_draw_img_rle(self):
+        page = pattern(32 * 4, 9)
+        rle = ssd1306img.rle_encode(page)
+        for sim, d in self.displays():
+            d.draw_img_rle(rle, 10, 1, 32, 4)
+            for p in range(4):
+                pos = (1 + p) * d._screen_width + 10
+                self.assertEqual(bytes(d._buf_display[pos:pos + 32]), page[p * 32:(p + 1) * 32])
+            d.draw_img_rle(rle, 50, 0, 32, 4, mode=2)
+            self.assertShown(sim, d)
+
+    def test_draw_img_rle_malformed(self):
+        page = pattern(32 * 4, 9)
+        rle = ssd1306img.rle_encode(page)
+        sim, d = self.make()
+        d.fill_rect(0, 0, 20, 20)
+        before = bytes(d._buf_display)
+        bad = (
+            rle[:-1],                                      # truncated run
+            rle + bytes([0x80, 0x11]),                     # too long
+            ssd1306img.rle_encode(page[:-1]),              # too short
+            bytes([0x7F]) + bytes(10),                     # literal past the end
+        )
+        for data in bad:
+            self.assertRaises(ValueError, d.draw_img_rle, data, 10, 1, 32, 4)
+            self.assertUnchanged(d, before)
+        self.assertShown(sim, d)
+
+
+class TestSprite(DriverTest):
+
+    def test_move_and_hide(self):
+        for sim, d in self.displays():
+            m = sim.module
+            d.draw_text("bg", 0, 0, 0, 0)
+            d.draw_line(0, 30, d._screen_width - 1, 10)
+            before = bytes(d._buf_display)
+            sprites = [m.Sprite(d, BALL, 8, 8, mask=BALL)]
+            for mode in (0, 2, 3):
+                sprites.append(m.Sprite(d, ARROW, 8, 12, mode=mode))
+            for sprite in sprites:
+                for x, y in ((0, 0), (5, 3), (-4, -6), (d._screen_width - 3, d._screen_height - 5), (40, 17)):
+                    sprite.move(x, y)
+                    self.assertShown(sim, d)
+                sprite.hide()
+                self.assertUnchanged(d, before)
+                self.assertShown(sim, d)
+
+    def test_padding_rows_not_drawn(self):
+        sim, d = self.make()
+        sprite = sim.module.Sprite(d, ARROW, 8, 12, mode=3)
+        sprite.move(10, 20)
+        rows = buffer_rows(d)
+        for y in range(32, 40):
+            self.assertEqual(rows[y][10:18], [0] * 8)
+
+
+class TestAnimation(DriverTest):
+
+    def test_steps(self):
+        frames = [pattern(24 * 2, seed) for seed in (1, 2, 3)]
+        frames.append(frames[0][:10] + bytes(38))
+        data = ssd1306img.delta_encode(frames)
+        for auto_flush in (True, False):
+            for sim, d in self.displays(auto_flush=auto_flush):
+                anim = sim.module.Animation(d, data, 20, 2, 24, 2)
+                self.assertEqual(anim.frames, len(frames))
+                anim.rewind()
+                for i in range(2 * len(frames)):
+                    k = i % len(frames)
+                    for p in range(2):
+                        pos = (2 + p) * d._screen_width + 20
+                        self.assertEqual(bytes(d._buf_display[pos:pos + 24]), frames[k][p * 24:(p + 1) * 24])
+                    d.show()
+                    self.assertShown(sim, d)
+                    anim.step()
+
+
+class TestConsole(DriverTest):
+
+    def test_lines(self):
+        for sim, d in self.displays():
+            con = sim.module.Console(d)
+            lines = ["line %d" % i for i in range(12)]
+            for text in lines:
+                con.write(text)
+            # the bottom line of the glass matches the same text drawn in the frame buffer
+            ref_sim, ref = self.make(sim.interface, d._screen_width, d._screen_height)
+            top = d._screen_height - con.line_pages * 8
+            ref.draw_text(lines[-1], 0, top + ((con.line_pages * 8 - d.font_height) >> 1), 0, 0)
+            self.assertEqual(sim.panel.frame()[top:], buffer_rows(ref)[top:])
+            con.close()
+            self.assertShown(sim, d)
+
+
+class TestScroll(DriverTest):
+
+    def test_pending_changes_sent_first(self):
+        for mode in ({"auto_flush": False}, {"async_flush": True}):
+            for sim, d in self.displays(**mode):
+                d.draw_text("TICKER", 0, 0, 0, 0)
+                d.scroll_horizontal(0, 1)
+                d.show()
+                self.assertShown(sim, d)
+                d.stop_scroll()
+
+    def test_stop_restores_frame(self):
+        for sim, d in self.displays():
+            d.draw_text("marquee", 0, 0, 0, 0)
+            d.scroll_horizontal(0, 1, direction=1, speed=2)
+            sim.panel.step(5)
+            tx = sim.stats.transactions
+            # drawing while scrolling only updates the frame buffer
+            d.fill_rect(0, 20, 30, 10)
+            self.assertEqual(sim.stats.transactions, tx)
+            d.stop_scroll()
+            self.assertShown(sim, d)
+            d.set_vertical_scroll_area(8, 24)
+            d.scroll_diagonal(0, 0, vertical_offset=3)
+            sim.panel.step(4)
+            d.stop_scroll()
+            self.assertShown(sim, d)
+
+    def test_bad_arguments(self):
+        sim, d = self.make()
+        self.assertRaises(ValueError, d.scroll_horizontal, 0, 8)
+        self.assertRaises(ValueError, d.scroll_horizontal, 3, 1)
+        self.assertRaises(ValueError, d.scroll_horizontal, 0, 1, speed=7)
+        self.assertRaises(ValueError, d.scroll_diagonal, 0, 1, vertical_offset=64)
+        self.assertRaises(ValueError, d.set_vertical_scroll_area, 60, 10)
+
+
+class TestFlushModes(DriverTest):
+
+    def test_deferred(self):
+        for sim, d in self.displays(auto_flush=False):
+            d.show()
+            before = sim.panel.frame()
+            d.fill_rect(4, 4, 20, 20)
+            d.draw_text("x", 40, 0, 0, 0)
+            self.assertEqual(sim.panel.frame(), before)
+            d.show()
+            self.assertShown(sim, d)
+
+    def test_async(self):
+        for sim, d in self.displays(async_flush=True):
+            for i in range(10):
+                d.fill_rect(i * 5, i * 3, 8, 8, i & 1 == 0)
+                d.show()
+            d.draw_text("done", 0, 0, 0, 0)
+            d.flush_now()
+            self.assertShown(sim, d)
+
+    def test_max_fps(self):
+        for sim, d in self.displays():
+            d.set_max_fps(200)
+            try:
+                d.fill_rect(0, 0, 50, 30)
+                d.draw_text("fps", 60, 0, 0, 0)
+                deadline = time.monotonic() + 1
+                while sim.panel.frame() != buffer_rows(d) and time.monotonic() < deadline:
+                    time.sleep(0.005)
+                self.assertShown(sim, d)
+                d.draw_text("now", 60, 20, 0, 0)
+                d.flush_now()
+                self.assertShown(sim, d)
+            finally:
+                d.set_max_fps(0)
+            self.assertRaises(ValueError, d.set_max_fps, -1)
+
+    def test_group(self):
+        sim, d = self.make()
+        d2 = sim.display()
+        d2.init(128, 64)
+        group = sim.module.DisplayGroup([d])
+        group.add(d2)
+        self.assertIs(d2.font, d.font)
+
+
+if __name__ == "__main__":
+    unittest.main()